@@ -59,6 +59,7 @@ class MemberAdmin(admin.ModelAdmin):
         "expiration_date",
         "home_phone",
     ]
+    list_select_related = ["member_type"]
     list_filter = ["member_type", "status", "home_state", "date_joined"]
     search_fields = [
         "member_id",
@@ -125,24 +126,28 @@ class MemberAdmin(admin.ModelAdmin):
     actions = ["make_active", "make_inactive", "mark_deceased"]
 
     def make_active(self, request, queryset):
-        queryset.update(status="active", date_inactivated=None)
-        self.message_user(request, f"{queryset.count()} members marked as active.")
+        updated = queryset.update(status="active", date_inactivated=None)
+        self.message_user(request, f"{updated} members marked as active.")
 
     make_active.short_description = "Mark selected members as active"
 
     def make_inactive(self, request, queryset):
         from django.utils import timezone
 
-        queryset.update(status="inactive", date_inactivated=timezone.now().date())
-        self.message_user(request, f"{queryset.count()} members marked as inactive.")
+        updated = queryset.update(
+            status="inactive", date_inactivated=timezone.now().date()
+        )
+        self.message_user(request, f"{updated} members marked as inactive.")
 
     make_inactive.short_description = "Mark selected members as inactive"
 
     def mark_deceased(self, request, queryset):
         from django.utils import timezone
 
-        queryset.update(status="deceased", date_inactivated=timezone.now().date())
-        self.message_user(request, f"{queryset.count()} members marked as deceased.")
+        updated = queryset.update(
+            status="deceased", date_inactivated=timezone.now().date()
+        )
+        self.message_user(request, f"{updated} members marked as deceased.")
 
     mark_deceased.short_description = "Mark selected members as deceased"
 
@@ -156,6 +161,7 @@ class PaymentAdmin(admin.ModelAdmin):
         "payment_method",
         "receipt_number",
     ]
+    list_select_related = ["member", "payment_method"]
     list_filter = ["payment_method", "date"]
     search_fields = [
         "member__first_name",
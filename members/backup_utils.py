@@ -2,14 +2,32 @@
 Utility functions for database backups.
 
 These functions handle creating and managing database backups using Django's dumpdata.
+Backups are written as gzip-compressed JSON (.json.gz), which loaddata reads directly.
+Each backup gets a .sha256 file alongside it in sha256sum format, so it can be
+verified later with `sha256sum -c`.
 """
 
+import gzip
+import hashlib
+import io
 import os
-import subprocess
-import sys
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
+
+import dj_database_url
 from django.conf import settings
+from django.core.management import call_command
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# Connection alias used while backing up production from a dev process
+PROD_BACKUP_ALIAS = "backup_prod"
+
+# Suffix of the checksum file written next to each backup
+CHECKSUM_SUFFIX = ".sha256"
+
+# Backups smaller than this (in bytes, compressed) are treated as failed exports
+MIN_BACKUP_SIZE = 100
 
 
 def _detect_database_type():
@@ -33,12 +51,88 @@ def _ensure_backup_directory(db_type):
     return backup_dir
 
 
-def create_backup(db_type=None):
+class _HashingWriter:
+    """Binary file wrapper that feeds every written chunk to a hash"""
+
+    def __init__(self, raw, digest):
+        self.raw = raw
+        self.digest = digest
+
+    def write(self, data):
+        self.digest.update(data)
+        return self.raw.write(data)
+
+    def flush(self):
+        self.raw.flush()
+
+
+@contextmanager
+def _open_hashed_gzip(filepath):
+    """
+    Open a file for gzip-compressed UTF-8 text, hashing it as it is written.
+
+    Yields (text stream, sha256 hash object). The hash covers the compressed
+    bytes as they reach the file, which is what `sha256sum -c` checks, so the
+    finished backup never has to be read back. It is complete once the block
+    exits.
+    """
+    digest = hashlib.sha256()
+    with (
+        open(filepath, "wb") as raw,
+        gzip.GzipFile(
+            filename=filepath.name, mode="wb", fileobj=_HashingWriter(raw, digest)
+        ) as compressed,
+        io.TextIOWrapper(compressed, encoding="utf-8") as stream,
+    ):
+        yield stream, digest
+
+
+def _write_checksum(filepath, sha256):
+    """
+    Write a backup's SHA-256 to a checksum file next to it.
+
+    Returns the checksum file's path.
+    """
+    checksum_path = filepath.with_name(filepath.name + CHECKSUM_SUFFIX)
+    checksum_path.write_text(f"{sha256}  {filepath.name}\n")
+    return checksum_path
+
+
+@contextmanager
+def _backup_database_alias(db_type, prod_url):
+    """
+    Yield the connection alias to back up from.
+
+    The current connection is used unless a prod backup is requested from a
+    dev process, in which case a temporary connection to prod_url is set up
+    for the duration of the backup.
+    """
+    if db_type != "prod" or _detect_database_type() == "prod":
+        yield DEFAULT_DB_ALIAS
+        return
+
+    databases = dict(connections.settings)
+    databases[PROD_BACKUP_ALIAS] = dj_database_url.parse(prod_url)
+    connections.settings[PROD_BACKUP_ALIAS] = connections.configure_settings(databases)[
+        PROD_BACKUP_ALIAS
+    ]
+    try:
+        yield PROD_BACKUP_ALIAS
+    finally:
+        connections[PROD_BACKUP_ALIAS].close()
+        del connections[PROD_BACKUP_ALIAS]
+        del connections.settings[PROD_BACKUP_ALIAS]
+
+
+def create_backup(db_type=None, fast=False):
     """
     Create backup of current database.
 
     Args:
         db_type: Optional database type ('dev' or 'prod'). If not provided, auto-detects.
+        fast: Serialize foreign keys as plain primary keys instead of natural keys.
+            Skips the natural_key() lookups, but the backup should only be
+            restored into the database it was taken from.
 
     Returns:
         dict: {
@@ -47,6 +141,8 @@ def create_backup(db_type=None):
             'filename': str or None,
             'size': int or None,
             'db_type': str or None,
+            'sha256': str or None,
+            'checksum_filepath': str or None,
             'error': str or None
         }
     """
@@ -58,72 +154,74 @@ def create_backup(db_type=None):
         # Ensure backup directory exists
         backup_dir = _ensure_backup_directory(db_type)
 
-        # Generate timestamped filename
+        # Generate timestamped filename (backups are gzip-compressed JSON)
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        filename = f"backup_{db_type}_{timestamp}.json"
+        filename = f"backup_{db_type}_{timestamp}.json.gz"
         filepath = backup_dir / filename
 
-        # Prepare environment for subprocess
-        env = os.environ.copy()
-        # If db_type is 'prod', use DATABASE_URL_PROD for the backup
-        if db_type == "prod":
-            prod_url = os.getenv("DATABASE_URL_PROD")
-            if prod_url:
-                env["DATABASE_URL"] = prod_url
-            else:
-                return {
-                    "success": False,
-                    "filepath": None,
-                    "filename": None,
-                    "size": None,
-                    "db_type": db_type,
-                    "error": "DATABASE_URL_PROD not set in environment",
-                }
-
-        # Run dumpdata command
-        result = subprocess.run(
-            [
-                sys.executable,
-                "manage.py",
-                "dumpdata",
-                "--natural-foreign",
-                "--natural-primary",
-                "--exclude=auth.Permission",
-                "--exclude=admin.LogEntry",
-                "--exclude=sessions.Session",
-            ],
-            capture_output=True,
-            text=True,
-            cwd=os.getcwd(),
-            env=env,
-        )
-
-        if result.returncode != 0:
+        # If db_type is 'prod', back up the database at DATABASE_URL_PROD
+        prod_url = os.getenv("DATABASE_URL_PROD")
+        if db_type == "prod" and not prod_url:
             return {
                 "success": False,
                 "filepath": None,
                 "filename": None,
                 "size": None,
                 "db_type": db_type,
-                "error": result.stderr or "Unknown error",
+                "sha256": None,
+                "checksum_filepath": None,
+                "error": "DATABASE_URL_PROD not set in environment",
             }
 
-        # Check if we got data
-        if not result.stdout or len(result.stdout.strip()) < 100:
+        # Run dumpdata in this process, streaming its output through gzip
+        # into the backup file and hashing the compressed bytes on the way
+        try:
+            with (
+                _backup_database_alias(db_type, prod_url) as database,
+                _open_hashed_gzip(filepath) as (stream, digest),
+            ):
+                call_command(
+                    "dumpdata",
+                    use_natural_foreign_keys=not fast,
+                    use_natural_primary_keys=not fast,
+                    exclude=["auth.Permission", "admin.LogEntry", "sessions.Session"],
+                    database=database,
+                    stdout=stream,
+                    verbosity=0,
+                )
+        except Exception as e:
+            filepath.unlink(missing_ok=True)
             return {
                 "success": False,
                 "filepath": None,
                 "filename": None,
                 "size": None,
                 "db_type": db_type,
-                "error": "Export seems empty or very small",
+                "sha256": None,
+                "checksum_filepath": None,
+                "error": str(e) or "Unknown error",
             }
 
-        # Write to file
-        with open(filepath, "w") as f:
-            f.write(result.stdout)
+        # Check if we got data (a single stat of the finished file)
+        try:
+            file_size = os.path.getsize(filepath)
+        except OSError:
+            file_size = 0
+        if file_size < MIN_BACKUP_SIZE:
+            filepath.unlink(missing_ok=True)
+            return {
+                "success": False,
+                "filepath": None,
+                "filename": None,
+                "size": None,
+                "db_type": db_type,
+                "sha256": None,
+                "checksum_filepath": None,
+                "error": "Export seems empty or very small",
+            }
 
-        file_size = os.path.getsize(filepath)
+        sha256 = digest.hexdigest()
+        checksum_path = _write_checksum(filepath, sha256)
 
         return {
             "success": True,
@@ -131,6 +229,8 @@ def create_backup(db_type=None):
             "filename": filename,
             "size": file_size,
             "db_type": db_type,
+            "sha256": sha256,
+            "checksum_filepath": str(checksum_path),
             "error": None,
         }
 
@@ -141,5 +241,7 @@ def create_backup(db_type=None):
             "filename": None,
             "size": None,
             "db_type": None,
+            "sha256": None,
+            "checksum_filepath": None,
             "error": str(e),
         }
@@ -8,6 +8,7 @@ This command:
 1. Detects current database type (dev or prod)
 2. Creates JSON backup using dumpdata
 3. Saves to backups/{db_type}/ directory with timestamp
+4. Writes a .sha256 checksum file next to the backup
 """
 
 from django.core.management.base import BaseCommand
@@ -23,10 +24,15 @@ class Command(BaseCommand):
             choices=["dev", "prod"],
             help="Database type (auto-detected if not provided)",
         )
+        parser.add_argument(
+            "--fast",
+            action="store_true",
+            help="Use primary keys instead of natural keys (same-database restores only)",
+        )
 
     def handle(self, *args, **options):
         db_type = options.get("db_type")
-        result = create_backup(db_type=db_type)
+        result = create_backup(db_type=db_type, fast=options["fast"])
 
         if result["success"]:
             self.stdout.write(
@@ -36,5 +42,6 @@ class Command(BaseCommand):
             )
             self.stdout.write(f"  Location: {result['filepath']}")
             self.stdout.write(f"  Database: {result['db_type']}")
+            self.stdout.write(f"  SHA-256: {result['sha256']}")
         else:
             self.stdout.write(self.style.ERROR(f"✗ Backup failed: {result['error']}"))
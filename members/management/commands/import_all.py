@@ -0,0 +1,88 @@
+from pathlib import Path
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+
+from members.models import Member, MemberType, Payment, PaymentMethod
+from .import_utils import clear_tables, import_transaction
+
+# Tables cleared by --clear-existing, dependents first so PROTECT never fires
+# (the ORM delete used off PostgreSQL goes in this order)
+CLEAR_ORDER = (Payment, Member, PaymentMethod, MemberType)
+
+
+class Command(BaseCommand):
+    help = (
+        "Import member types, payment methods, members and payments in one transaction"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--data-dir",
+            type=str,
+            default="data/2025_09_02/cleaned",
+            help="Directory containing the cleaned current_*.csv files",
+        )
+        parser.add_argument(
+            "--clear-existing",
+            action="store_true",
+            help="Clear existing payments, members, payment methods and member types before import",
+        )
+        parser.add_argument(
+            "--use-copy",
+            action="store_true",
+            help="Insert members and payments with PostgreSQL COPY (requires django-bulk-load)",
+        )
+
+    def handle(self, *args, **options):
+        data_dir = Path(options["data_dir"])
+        csv_files = {
+            "member_types": data_dir / "current_member_types.csv",
+            "payment_methods": data_dir / "current_payment_methods.csv",
+            "members": data_dir / "current_members.csv",
+            "dead": data_dir / "current_dead.csv",
+            "payments": data_dir / "current_payments.csv",
+        }
+
+        # Check every file before anything is written
+        missing = [str(path) for path in csv_files.values() if not path.exists()]
+        if missing:
+            raise CommandError(f"CSV file(s) not found: {', '.join(missing)}")
+
+        output = {"stdout": self.stdout, "stderr": self.stderr}
+
+        # One outer transaction: each command's own transaction becomes a
+        # savepoint, and a failure in any step rolls back the whole load
+        with import_transaction():
+            if options["clear_existing"]:
+                self.stdout.write("🗑️  Clearing existing data...")
+                # One TRUNCATE on PostgreSQL, which needs the referencing
+                # tables cleared in the same statement
+                clear_tables(*CLEAR_ORDER)
+                self.stdout.write("   ✅ Existing data cleared")
+
+            call_command(
+                "import_member_types", csv_file=csv_files["member_types"], **output
+            )
+            call_command(
+                "import_payment_methods",
+                csv_file=csv_files["payment_methods"],
+                **output,
+            )
+            call_command(
+                "import_members",
+                members_csv=csv_files["members"],
+                dead_csv=csv_files["dead"],
+                use_copy=options["use_copy"],
+                **output,
+            )
+            call_command(
+                "import_payments",
+                csv_file=csv_files["payments"],
+                use_copy=options["use_copy"],
+                **output,
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS("\n✅ Full import completed successfully!")
+        )
@@ -1,20 +1,42 @@
 """
 Enhanced logging utility for import commands.
 Creates detailed log files with all errors, successes, and skipped records.
+The error log is gzip-compressed, since a badly broken CSV can produce a
+record for every row; read it with zless or zcat.
+
+ImportLogger is thread-safe: record numbering, counters and file writes are
+serialized by a lock, so worker threads (or several imports) can share one
+logger. Database writes are not covered; each worker must still run its
+ORM work on its own connection inside its own transaction.atomic() block.
 """
 
+import gzip
 import os
+import threading
 from datetime import datetime
 from pathlib import Path
 
+# Log files are written through 64 KiB buffers instead of reopened per record
+LOG_BUFFER_SIZE = 1 << 16
+
+# Fastest gzip level; repetitive log text still compresses several times over
+ERROR_LOG_COMPRESSLEVEL = 1
+
 
 class ImportLogger:
     """Enhanced logging for import commands with file output"""
 
+    # Record separators: errors, successes, and skipped/duplicate notices
+    ERROR_SEPARATOR = "-" * 50 + "\n\n"
+    SUCCESS_SEPARATOR = "-" * 30 + "\n\n"
+    NOTICE_SEPARATOR = "-" * 40 + "\n\n"
+
     def __init__(self, command_name, csv_file_path):
         self.command_name = command_name
         self.csv_file_path = Path(csv_file_path)
         self.csv_filename = self.csv_file_path.name
+        # Same for every record, so formatted once
+        self._file_line = f"File: {self.csv_filename}\n"
 
         # Create logs directory if it doesn't exist
         self.logs_dir = Path("logs/imports")
@@ -25,7 +47,7 @@ class ImportLogger:
 
         # Create log file paths
         self.error_log_file = (
-            self.logs_dir / f"{self.command_name}_{self.timestamp}_ERRORS.log"
+            self.logs_dir / f"{self.command_name}_{self.timestamp}_ERRORS.log.gz"
         )
         self.success_log_file = (
             self.logs_dir / f"{self.command_name}_{self.timestamp}_SUCCESS.log"
@@ -40,93 +62,123 @@ class ImportLogger:
         self.skipped_count = 0
         self.duplicate_count = 0
 
-        # Initialize log files
-        self._init_log_files()
-
-    def _init_log_files(self):
-        """Initialize log files with headers"""
-        # Error log header
-        with open(self.error_log_file, "w") as f:
-            f.write(f"ERROR LOG - {self.command_name.upper()}\n")
-            f.write(f"Timestamp: {self.timestamp}\n")
-            f.write(f"CSV File: {self.csv_file_path}\n")
-            f.write("=" * 80 + "\n\n")
+        # Log files are created on their first record and kept open until close
+        self._error_header = self._log_header("ERROR LOG")
+        self._success_header = self._log_header("SUCCESS LOG")
+        self._error_fh = None
+        self._success_fh = None
+        # Guards the counters and both file handles
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Flush and close the error and success log files that were opened"""
+        with self._lock:
+            for fh in (self._error_fh, self._success_fh):
+                if fh is not None and not fh.closed:
+                    fh.close()
+
+    def _log_header(self, title):
+        """Build the header written at the top of a row log file"""
+        return (
+            f"{title} - {self.command_name.upper()}\n"
+            f"Timestamp: {self.timestamp}\n"
+            f"CSV File: {self.csv_file_path}\n" + "=" * 80 + "\n\n"
+        )
 
-        # Success log header
-        with open(self.success_log_file, "w") as f:
-            f.write(f"SUCCESS LOG - {self.command_name.upper()}\n")
-            f.write(f"Timestamp: {self.timestamp}\n")
-            f.write(f"CSV File: {self.csv_file_path}\n")
-            f.write("=" * 80 + "\n\n")
+    def _error_log(self):
+        """Return the error log handle, creating the file on first use (lock held)"""
+        if self._error_fh is None:
+            self._error_fh = gzip.open(
+                self.error_log_file,
+                "wt",
+                encoding="utf-8",
+                compresslevel=ERROR_LOG_COMPRESSLEVEL,
+            )
+            self._error_fh.write(self._error_header)
+        return self._error_fh
+
+    def _success_log(self):
+        """Return the success log handle, creating the file on first use (lock held)"""
+        if self._success_fh is None:
+            self._success_fh = open(
+                self.success_log_file, "w", buffering=LOG_BUFFER_SIZE
+            )
+            self._success_fh.write(self._success_header)
+        return self._success_fh
+
+    @staticmethod
+    def _format_row_data(row_data):
+        """Format row data as an indented block for a log record"""
+        if not row_data:
+            return ""
+        return "Row Data:\n" + "".join(
+            f"  {key}: {value}\n" for key, value in row_data.items()
+        )
 
     def log_error(self, row_num, error_message, row_data=None):
         """Log an error with row details"""
-        self.error_count += 1
-
-        with open(self.error_log_file, "a") as f:
-            f.write(f"ERROR #{self.error_count}\n")
-            f.write(f"File: {self.csv_filename}\n")
-            f.write(f"Row: {row_num}\n")
-            f.write(f"Error: {error_message}\n")
-
-            if row_data:
-                f.write("Row Data:\n")
-                for key, value in row_data.items():
-                    f.write(f"  {key}: {value}\n")
-
-            f.write("-" * 50 + "\n\n")
+        record = (
+            f"{self._file_line}"
+            f"Row: {row_num}\n"
+            f"Error: {error_message}\n"
+            f"{self._format_row_data(row_data)}"
+            f"{self.ERROR_SEPARATOR}"
+        )
+        with self._lock:
+            self.error_count += 1
+            self._error_log().write(f"ERROR #{self.error_count}\n{record}")
 
     def log_success(self, row_num, success_message, created_object=None):
         """Log a successful import"""
-        self.created_count += 1
-
-        with open(self.success_log_file, "a") as f:
-            f.write(f"SUCCESS #{self.created_count}\n")
-            f.write(f"File: {self.csv_filename}\n")
-            f.write(f"Row: {row_num}\n")
-            f.write(f"Result: {success_message}\n")
-
-            if created_object:
-                f.write(f"Created: {created_object}\n")
-
-            f.write("-" * 30 + "\n\n")
+        created = f"Created: {created_object}\n" if created_object else ""
+        record = (
+            f"{self._file_line}"
+            f"Row: {row_num}\n"
+            f"Result: {success_message}\n"
+            f"{created}"
+            f"{self.SUCCESS_SEPARATOR}"
+        )
+        with self._lock:
+            self.created_count += 1
+            self._success_log().write(f"SUCCESS #{self.created_count}\n{record}")
 
     def log_skipped(self, row_num, reason, row_data=None):
         """Log a skipped record"""
-        self.skipped_count += 1
-
-        with open(self.error_log_file, "a") as f:
-            f.write(f"SKIPPED #{self.skipped_count}\n")
-            f.write(f"File: {self.csv_filename}\n")
-            f.write(f"Row: {row_num}\n")
-            f.write(f"Reason: {reason}\n")
-
-            if row_data:
-                f.write("Row Data:\n")
-                for key, value in row_data.items():
-                    f.write(f"  {key}: {value}\n")
-
-            f.write("-" * 40 + "\n\n")
+        record = (
+            f"{self._file_line}"
+            f"Row: {row_num}\n"
+            f"Reason: {reason}\n"
+            f"{self._format_row_data(row_data)}"
+            f"{self.NOTICE_SEPARATOR}"
+        )
+        with self._lock:
+            self.skipped_count += 1
+            self._error_log().write(f"SKIPPED #{self.skipped_count}\n{record}")
 
     def log_duplicate(self, row_num, duplicate_info, row_data=None):
         """Log a duplicate record"""
-        self.duplicate_count += 1
-
-        with open(self.error_log_file, "a") as f:
-            f.write(f"DUPLICATE #{self.duplicate_count}\n")
-            f.write(f"File: {self.csv_filename}\n")
-            f.write(f"Row: {row_num}\n")
-            f.write(f"Duplicate: {duplicate_info}\n")
-
-            if row_data:
-                f.write("Row Data:\n")
-                for key, value in row_data.items():
-                    f.write(f"  {key}: {value}\n")
-
-            f.write("-" * 40 + "\n\n")
+        record = (
+            f"{self._file_line}"
+            f"Row: {row_num}\n"
+            f"Duplicate: {duplicate_info}\n"
+            f"{self._format_row_data(row_data)}"
+            f"{self.NOTICE_SEPARATOR}"
+        )
+        with self._lock:
+            self.duplicate_count += 1
+            self._error_log().write(f"DUPLICATE #{self.duplicate_count}\n{record}")
 
     def write_summary(self, additional_stats=None):
         """Write final summary to summary log file"""
+        # Flush the row logs so they are complete before the summary is written
+        self.close()
+
         with open(self.summary_log_file, "w") as f:
             f.write(f"IMPORT SUMMARY - {self.command_name.upper()}\n")
             f.write(f"Timestamp: {self.timestamp}\n")
@@ -149,31 +201,57 @@ class ImportLogger:
                 f.write("\n")
 
             f.write("LOG FILES:\n")
-            f.write(f"  Errors/Skipped: {self.error_log_file}\n")
-            f.write(f"  Successes: {self.success_log_file}\n")
+            f.write(
+                f"  Errors/Skipped: {self._log_file_label(self._error_fh, self.error_log_file)}\n"
+            )
+            f.write(
+                f"  Successes: {self._log_file_label(self._success_fh, self.success_log_file)}\n"
+            )
             f.write(f"  Summary: {self.summary_log_file}\n")
 
+    @staticmethod
+    def _log_file_label(fh, path):
+        """Path of a row log for the summary, or "(none)" if it was never created"""
+        if fh is None:
+            return "(none)"
+        return path
+
     def print_console_summary(self, stdout):
-        """Print summary to console"""
-        stdout.write(f"\n📊 Import Summary:")
-        stdout.write(f"   ✅ Created: {self.created_count}")
-        stdout.write(f"   ❌ Errors: {self.error_count}")
-        stdout.write(f"   ⚠️  Skipped: {self.skipped_count}")
-        stdout.write(f"   🔄 Duplicates: {self.duplicate_count}")
-        stdout.write(f"\n📁 Detailed logs written to:")
-        stdout.write(f"   {self.error_log_file}")
-        stdout.write(f"   {self.success_log_file}")
-        stdout.write(f"   {self.summary_log_file}")
+        """Print summary to console (as a single write)"""
+        lines = [
+            "\n📊 Import Summary:",
+            f"   ✅ Created: {self.created_count}",
+            f"   ❌ Errors: {self.error_count}",
+            f"   ⚠️  Skipped: {self.skipped_count}",
+            f"   🔄 Duplicates: {self.duplicate_count}",
+            "\n📁 Detailed logs written to:",
+        ]
+        if self._error_fh is not None:
+            lines.append(f"   {self.error_log_file}")
+        if self._success_fh is not None:
+            lines.append(f"   {self.success_log_file}")
+        lines.append(f"   {self.summary_log_file}")
+        # The stdout wrapper adds the final newline
+        stdout.write("\n".join(lines))
+
+    def print_progress(self, stdout):
+        """Print a one-line running total to console"""
+        stats = self.get_stats()
+        stdout.write(
+            f"   ⏳ {stats['total']} rows processed "
+            f"({stats['created']} created, {stats['errors']} errors)"
+        )
 
     def get_stats(self):
         """Return current statistics"""
-        return {
-            "created": self.created_count,
-            "errors": self.error_count,
-            "skipped": self.skipped_count,
-            "duplicates": self.duplicate_count,
-            "total": self.created_count
-            + self.error_count
-            + self.skipped_count
-            + self.duplicate_count,
-        }
+        with self._lock:
+            return {
+                "created": self.created_count,
+                "errors": self.error_count,
+                "skipped": self.skipped_count,
+                "duplicates": self.duplicate_count,
+                "total": self.created_count
+                + self.error_count
+                + self.skipped_count
+                + self.duplicate_count,
+            }
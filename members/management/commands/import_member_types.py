@@ -1,12 +1,20 @@
 import csv
-from decimal import Decimal
 from pathlib import Path
 
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
 
 from members.models import MemberType
 from .import_logger import ImportLogger
+from .import_utils import (
+    BatchInserter,
+    clear_tables,
+    import_transaction,
+    open_csv,
+    parse_amount,
+    read_csv_header,
+)
+
+MEMBER_TYPE_COLUMNS = ("member_type", "member_dues", "num_months")
 
 
 class Command(BaseCommand):
@@ -31,13 +39,14 @@ class Command(BaseCommand):
         if not csv_file.exists():
             raise CommandError(f"CSV file not found: {csv_file}")
 
-        if options["clear_existing"]:
-            self.stdout.write("🗑️  Clearing existing member types...")
-            MemberType.objects.all().delete()
-            self.stdout.write("   ✅ Member types cleared")
-
         try:
-            with transaction.atomic():
+            with import_transaction():
+                # Cleared in the import transaction so a failed import rolls it back
+                if options["clear_existing"]:
+                    self.stdout.write("🗑️  Clearing existing member types...")
+                    clear_tables(MemberType)
+                    self.stdout.write("   ✅ Member types cleared")
+
                 self.import_member_types(csv_file)
                 self.stdout.write(
                     self.style.SUCCESS(
@@ -53,70 +62,87 @@ class Command(BaseCommand):
         self.stdout.write(f"\n🏷️  Importing member types from: {csv_file}")
 
         # Initialize enhanced logger
-        logger = ImportLogger("import_member_types", csv_file)
-
-        with open(csv_file, "r", encoding="utf-8") as file:
-            reader = csv.DictReader(file)
-
-            for row_num, row in enumerate(reader, 2):  # Start at 2 (after header)
-                try:
-                    # Required fields
-                    member_type = row.get("member_type", "").strip()
-                    if not member_type:
-                        logger.log_error(row_num, "Missing member_type", row)
-                        continue
-
-                    # Parse member_dues
+        with ImportLogger("import_member_types", csv_file) as logger:
+            # Load existing member types once instead of a get_or_create per row
+            existing = set(MemberType.objects.values_list("member_type", flat=True))
+            # ignore_conflicts: a row inserted concurrently is skipped, not an error
+            inserter = BatchInserter(MemberType, ignore_conflicts=True)
+
+            with open_csv(csv_file) as file:
+                reader = csv.reader(file)
+                header, columns = read_csv_header(reader, MEMBER_TYPE_COLUMNS)
+                member_type_i = columns["member_type"]
+                member_dues_i = columns["member_dues"]
+                num_months_i = columns["num_months"]
+
+                for row_num, row in enumerate(reader, 2):  # Start at 2 (after header)
                     try:
-                        member_dues = Decimal(str(row["member_dues"]).strip())
-                    except (ValueError, TypeError):
-                        logger.log_error(
-                            row_num,
-                            f"Invalid member_dues '{row.get('member_dues')}'",
-                            row,
+                        # Required fields
+                        member_type = row[member_type_i].strip()
+                        if not member_type:
+                            logger.log_error(
+                                row_num, "Missing member_type", dict(zip(header, row))
+                            )
+                            continue
+
+                        # Parse member_dues
+                        member_dues = parse_amount(row[member_dues_i])
+                        if member_dues is None:
+                            logger.log_error(
+                                row_num,
+                                f"Invalid member_dues '{row[member_dues_i]}'",
+                                dict(zip(header, row)),
+                            )
+                            continue
+
+                        # Parse num_months
+                        try:
+                            num_months = int(row[num_months_i])
+                        except ValueError:
+                            logger.log_error(
+                                row_num,
+                                f"Invalid num_months '{row[num_months_i]}'",
+                                dict(zip(header, row)),
+                            )
+                            continue
+
+                        if member_type in existing:
+                            logger.log_skipped(
+                                row_num,
+                                f"Member type already exists: {member_type}",
+                                dict(zip(header, row)),
+                            )
+                            if logger.skipped_count <= 5:  # Show first 5 on console
+                                self.stdout.write(f"   ⚠️  Exists: {member_type}")
+                            continue
+
+                        member_type_obj = MemberType(
+                            member_type=member_type,
+                            member_dues=member_dues,
+                            num_months=num_months,
                         )
-                        continue
-
-                    # Parse num_months
-                    try:
-                        num_months = int(row["num_months"])
-                    except (ValueError, TypeError):
+                    except Exception as e:
                         logger.log_error(
-                            row_num,
-                            f"Invalid num_months '{row.get('num_months')}'",
-                            row,
+                            row_num, f"Unexpected error - {e}", dict(zip(header, row))
                         )
                         continue
 
-                    # Create or get member type
-                    member_type_obj, created = MemberType.objects.get_or_create(
-                        member_type=member_type,
-                        defaults={
-                            "member_dues": member_dues,
-                            "num_months": num_months,
-                        },
-                    )
+                    # Outside the try: a failed batch insert aborts the import
+                    inserter.add(member_type_obj)
+                    existing.add(member_type)
 
-                    if created:
-                        logger.log_success(
-                            row_num,
-                            f"Created member type: {member_type}",
-                            member_type_obj,
-                        )
-                        if logger.created_count <= 5:  # Show first 5 on console
-                            self.stdout.write(f"   ✅ Created: {member_type_obj}")
-                    else:
-                        logger.log_skipped(
-                            row_num, f"Member type already exists: {member_type}", row
-                        )
-                        if logger.skipped_count <= 5:  # Show first 5 on console
-                            self.stdout.write(f"   ⚠️  Exists: {member_type_obj}")
+                    logger.log_success(
+                        row_num,
+                        f"Created member type: {member_type}",
+                        member_type_obj,
+                    )
+                    if logger.created_count <= 5:  # Show first 5 on console
+                        self.stdout.write(f"   ✅ Created: {member_type_obj}")
 
-                except Exception as e:
-                    logger.log_error(row_num, f"Unexpected error - {e}", row)
+            inserter.flush()
 
-        # Write detailed logs to files
-        logger.write_summary()
+            # Write detailed logs to files
+            logger.write_summary()
 
-        # Show console summary
-        logger.print_console_summary(self.stdout)
+            # Show console summary
+            logger.print_console_summary(self.stdout)
@@ -1,13 +1,46 @@
 import csv
 from datetime import timedelta
+from operator import itemgetter
 from pathlib import Path
 
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
-from django.utils.dateparse import parse_date
+from django.db import connection
 
 from members.models import Member, MemberType
 from .import_logger import ImportLogger
+from .import_utils import (
+    PROGRESS_INTERVAL,
+    BatchInserter,
+    clear_tables,
+    copy_available,
+    dropped_indexes,
+    import_transaction,
+    member_name_key,
+    open_csv,
+    parse_csv_date,
+    parse_member_id,
+    read_ahead,
+    read_csv_header,
+)
+
+MEMBER_COLUMNS = (
+    "member_id",
+    "first_name",
+    "last_name",
+    "email",
+    "member_type",
+    "date_joined",
+    "expiration_date",
+    "milestone_date",
+    "home_address",
+    "home_city",
+    "home_state",
+    "home_zip",
+    "home_phone",
+)
+
+# Inactive members are marked inactive 3 months after their expiration date
+INACTIVATION_DELAY = timedelta(days=90)
 
 
 class Command(BaseCommand):
@@ -31,6 +64,16 @@ class Command(BaseCommand):
             action="store_true",
             help="Clear existing members before import",
         )
+        parser.add_argument(
+            "--use-copy",
+            action="store_true",
+            help="Insert rows with PostgreSQL COPY (requires django-bulk-load)",
+        )
+        parser.add_argument(
+            "--rebuild-indexes",
+            action="store_true",
+            help="Drop secondary indexes during the load and rebuild them after (PostgreSQL)",
+        )
 
     def handle(self, *args, **options):
         members_csv = Path(options["members_csv"])
@@ -42,28 +85,55 @@ class Command(BaseCommand):
         if not dead_csv.exists():
             raise CommandError(f"Inactive members CSV file not found: {dead_csv}")
 
-        if options["clear_existing"]:
-            self.stdout.write("🗑️  Clearing existing members...")
-            Member.objects.all().delete()
-            self.stdout.write("   ✅ Members cleared")
+        self.use_copy = options["use_copy"] and copy_available()
+        if options["use_copy"] and not self.use_copy:
+            self.stdout.write(
+                "⚠️  COPY needs PostgreSQL and django-bulk-load - using bulk_create"
+            )
+
+        self.rebuild_indexes = options["rebuild_indexes"]
+        if self.rebuild_indexes and connection.vendor != "postgresql":
+            self.stdout.write(
+                "⚠️  --rebuild-indexes needs PostgreSQL - keeping indexes"
+            )
 
         try:
-            with transaction.atomic():
-                # Import active members first
-                active_count = self.import_active_members(members_csv)
+            # Import active members first
+            with import_transaction():
+                # Cleared in the active stage's transaction, so a failure in this
+                # stage restores the cleared rows. The inactive stage commits
+                # separately: if it fails, the clear and active members stay.
+                if options["clear_existing"]:
+                    self.stdout.write("🗑️  Clearing existing members...")
+                    clear_tables(Member)
+                    self.stdout.write("   ✅ Members cleared")
+
+                # Load lookups once instead of querying per CSV row
+                self.member_type_pk_by_name = dict(
+                    MemberType.objects.values_list("member_type", "pk")
+                )
+                self.used_member_ids = set(
+                    Member.objects.filter(member_id__isnull=False).values_list(
+                        "member_id", flat=True
+                    )
+                )
+
+                with dropped_indexes(Member, self.rebuild_indexes):
+                    active_count = self.import_active_members(members_csv)
 
-                # Import inactive members second (with duplicate checking)
+            # Import inactive members second (with duplicate checking)
+            with import_transaction(), dropped_indexes(Member, self.rebuild_indexes):
                 inactive_count, duplicates_count = self.import_inactive_members(
                     dead_csv
                 )
 
-                self.stdout.write(
-                    self.style.SUCCESS("\n✅ Member import completed successfully!")
-                )
-                self.stdout.write(f"   👥 Active members imported: {active_count}")
-                self.stdout.write(f"   💀 Inactive members imported: {inactive_count}")
-                if duplicates_count > 0:
-                    self.stdout.write(f"   ⚠️  Duplicates skipped: {duplicates_count}")
+            self.stdout.write(
+                self.style.SUCCESS("\n✅ Member import completed successfully!")
+            )
+            self.stdout.write(f"   👥 Active members imported: {active_count}")
+            self.stdout.write(f"   💀 Inactive members imported: {inactive_count}")
+            if duplicates_count > 0:
+                self.stdout.write(f"   ⚠️  Duplicates skipped: {duplicates_count}")
 
         except Exception as e:
             raise CommandError(f"Import failed: {e}")
@@ -73,17 +143,34 @@ class Command(BaseCommand):
         self.stdout.write(f"\n👥 Importing ACTIVE members from: {csv_file}")
 
         # Initialize enhanced logger
-        logger = ImportLogger("import_active_members", csv_file)
+        with ImportLogger("import_active_members", csv_file) as logger:
+            inserter = BatchInserter(Member, use_copy=self.use_copy)
+
+            with open_csv(csv_file) as file:
+                reader = csv.reader(file)
+                self.header, self.columns = read_csv_header(reader, MEMBER_COLUMNS)
+                self.member_fields = itemgetter(
+                    *(self.columns[name] for name in MEMBER_COLUMNS)
+                )
 
-        with open(csv_file, "r", encoding="utf-8") as file:
-            reader = csv.DictReader(file)
+                for row_num, row in enumerate(
+                    read_ahead(reader), 2
+                ):  # Row 1 is the header
+                    if row_num % PROGRESS_INTERVAL == 0:
+                        logger.print_progress(self.stdout)
+                    try:
+                        member = self.build_member_from_row(
+                            row, row_num, logger, is_active=True
+                        )
+                    except Exception as e:
+                        logger.log_error(
+                            row_num, f"Unexpected error - {e}", self.row_data(row)
+                        )
+                        continue
 
-            for row_num, row in enumerate(reader, 2):  # Start at 2 (after header)
-                try:
-                    member = self.create_member_from_row(
-                        row, row_num, logger, is_active=True
-                    )
+                    # Outside the try: a failed batch insert aborts the import
                     if member:
+                        inserter.add(member)
                         logger.log_success(
                             row_num,
                             f"Created active member: {member.full_name} (ID: {member.member_id})",
@@ -92,12 +179,11 @@ class Command(BaseCommand):
                         if logger.created_count <= 5:  # Show first 5
                             self.stdout.write(f"   ✅ Created: {member}")
 
-                except Exception as e:
-                    logger.log_error(row_num, f"Unexpected error - {e}", row)
+            inserter.flush()
 
-        # Write detailed logs
-        logger.write_summary()
-        logger.print_console_summary(self.stdout)
+            # Write detailed logs
+            logger.write_summary()
+            logger.print_console_summary(self.stdout)
 
         return logger.created_count
 
@@ -106,35 +192,62 @@ class Command(BaseCommand):
         self.stdout.write(f"\n💀 Importing INACTIVE members from: {csv_file}")
 
         # Initialize enhanced logger
-        logger = ImportLogger("import_inactive_members", csv_file)
-
-        with open(csv_file, "r", encoding="utf-8") as file:
-            reader = csv.DictReader(file)
-
-            for row_num, row in enumerate(reader, 2):  # Start at 2 (after header)
-                try:
-                    first_name = row.get("first_name", "").strip()
-                    last_name = row.get("last_name", "").strip()
+        with ImportLogger("import_inactive_members", csv_file) as logger:
+            inserter = BatchInserter(Member, use_copy=self.use_copy)
+
+            # Names already in the database (including the active members just imported)
+            existing_names = {
+                member_name_key(first_name, last_name)
+                for first_name, last_name in Member.objects.values_list(
+                    "first_name", "last_name"
+                )
+            }
 
-                    # Check for duplicate (same first_name + last_name as active member)
-                    if Member.objects.filter(
-                        first_name__iexact=first_name, last_name__iexact=last_name
-                    ).exists():
-                        logger.log_duplicate(
-                            row_num,
-                            f"Member already exists: {first_name} {last_name}",
-                            row,
-                        )
-                        if logger.duplicate_count <= 5:  # Show first 5 duplicates
-                            self.stdout.write(
-                                f"   ⚠️  Duplicate skipped: {first_name} {last_name}"
+            with open_csv(csv_file) as file:
+                reader = csv.reader(file)
+                self.header, self.columns = read_csv_header(reader, MEMBER_COLUMNS)
+                self.member_fields = itemgetter(
+                    *(self.columns[name] for name in MEMBER_COLUMNS)
+                )
+                first_name_i = self.columns["first_name"]
+                last_name_i = self.columns["last_name"]
+
+                for row_num, row in enumerate(
+                    read_ahead(reader), 2
+                ):  # Row 1 is the header
+                    if row_num % PROGRESS_INTERVAL == 0:
+                        logger.print_progress(self.stdout)
+                    try:
+                        first_name = row[first_name_i].strip()
+                        last_name = row[last_name_i].strip()
+
+                        # Check for duplicate (same first_name + last_name as active member)
+                        name_key = member_name_key(first_name, last_name)
+                        if name_key in existing_names:
+                            logger.log_duplicate(
+                                row_num,
+                                f"Member already exists: {first_name} {last_name}",
+                                self.row_data(row),
                             )
+                            if logger.duplicate_count <= 5:  # Show first 5 duplicates
+                                self.stdout.write(
+                                    f"   ⚠️  Duplicate skipped: {first_name} {last_name}"
+                                )
+                            continue
+
+                        member = self.build_member_from_row(
+                            row, row_num, logger, is_active=False
+                        )
+                    except Exception as e:
+                        logger.log_error(
+                            row_num, f"Unexpected error - {e}", self.row_data(row)
+                        )
                         continue
 
-                    member = self.create_member_from_row(
-                        row, row_num, logger, is_active=False
-                    )
+                    # Outside the try: a failed batch insert aborts the import
                     if member:
+                        inserter.add(member)
+                        existing_names.add(name_key)
                         logger.log_success(
                             row_num,
                             f"Created inactive member: {member.full_name} (Preferred ID: {member.preferred_member_id})",
@@ -143,64 +256,90 @@ class Command(BaseCommand):
                         if logger.created_count <= 5:  # Show first 5
                             self.stdout.write(f"   ✅ Created: {member}")
 
-                except Exception as e:
-                    logger.log_error(row_num, f"Unexpected error - {e}", row)
+            inserter.flush()
 
-        # Write detailed logs
-        logger.write_summary({"Total duplicates skipped": logger.duplicate_count})
-        logger.print_console_summary(self.stdout)
+            # Write detailed logs
+            logger.write_summary({"Total duplicates skipped": logger.duplicate_count})
+            logger.print_console_summary(self.stdout)
 
         return logger.created_count, logger.duplicate_count
 
-    def create_member_from_row(self, row, row_num, logger, is_active=True):
-        """Create a member from CSV row data"""
-        # Required fields
-        first_name = row.get("first_name", "").strip()
-        last_name = row.get("last_name", "").strip()
-        member_type_name = row.get("member_type", "").strip()
+    def build_member_from_row(self, row, row_num, logger, is_active=True):
+        """Build an unsaved member from a CSV row (list of column values)"""
+        # All member columns in MEMBER_COLUMNS order, extracted in one call
+        (
+            csv_member_id,
+            first_name,
+            last_name,
+            email,
+            member_type_name,
+            raw_date_joined,
+            raw_expiration_date,
+            raw_milestone_date,
+            home_address,
+            home_city,
+            home_state,
+            home_zip,
+            home_phone,
+        ) = [value.strip() for value in self.member_fields(row)]
 
+        # Required fields
         if not first_name or not last_name:
-            logger.log_error(row_num, "Missing first_name or last_name", row)
+            logger.log_error(
+                row_num, "Missing first_name or last_name", self.row_data(row)
+            )
             return None
 
         if not member_type_name:
-            logger.log_error(row_num, "Missing member_type", row)
+            logger.log_error(row_num, "Missing member_type", self.row_data(row))
             return None
 
         # Get member type
-        try:
-            member_type = MemberType.objects.get(member_type=member_type_name)
-        except MemberType.DoesNotExist:
+        member_type_pk = self.member_type_pk_by_name.get(member_type_name)
+        if member_type_pk is None:
             logger.log_error(
-                row_num, f"Member type '{member_type_name}' not found", row
+                row_num,
+                f"Member type '{member_type_name}' not found",
+                self.row_data(row),
             )
             return None
 
         # Parse dates
-        date_joined = parse_date(row.get("date_joined", ""))
+        date_joined = parse_csv_date(raw_date_joined)
         if not date_joined:
-            logger.log_error(row_num, "Invalid or missing date_joined", row)
+            logger.log_error(
+                row_num, "Invalid or missing date_joined", self.row_data(row)
+            )
             return None
 
-        expiration_date = parse_date(row.get("expiration_date", ""))
+        expiration_date = parse_csv_date(raw_expiration_date)
         if not expiration_date:
-            logger.log_error(row_num, "Invalid or missing expiration_date", row)
+            logger.log_error(
+                row_num, "Invalid or missing expiration_date", self.row_data(row)
+            )
             return None
 
         milestone_date = None
-        if row.get("milestone_date"):
-            milestone_date = parse_date(row.get("milestone_date"))
+        if raw_milestone_date:
+            milestone_date = parse_csv_date(raw_milestone_date)
 
         # Handle member_id and status
-        csv_member_id = row.get("member_id", "").strip()
         member_id = None
         preferred_member_id = None
         status = "active" if is_active else "inactive"
         date_inactivated = None
 
-        if csv_member_id and csv_member_id.isdigit():
-            csv_member_id_int = int(csv_member_id)
+        csv_member_id_int = parse_member_id(csv_member_id)
+        if csv_member_id_int is not None:
             if is_active:
+                if csv_member_id_int in self.used_member_ids:
+                    logger.log_error(
+                        row_num,
+                        f"Member ID {csv_member_id_int} already in use",
+                        self.row_data(row),
+                    )
+                    return None
+                self.used_member_ids.add(csv_member_id_int)
                 # Active member keeps their ID
                 member_id = csv_member_id_int
                 preferred_member_id = csv_member_id_int
@@ -208,20 +347,19 @@ class Command(BaseCommand):
                 # Inactive member: ID goes to preferred, member_id becomes None
                 member_id = None
                 preferred_member_id = csv_member_id_int
-                # Calculate date_inactivated as expiration_date + 3 months
-                date_inactivated = expiration_date + timedelta(days=90)
+                date_inactivated = expiration_date + INACTIVATION_DELAY
 
-        # Create member
-        member = Member.objects.create(
+        # Build member (saved in batches by the caller)
+        member = Member(
             # Identity
             member_id=member_id,
             preferred_member_id=preferred_member_id,
             # Basic info
             first_name=first_name,
             last_name=last_name,
-            email=row.get("email", "").strip(),
+            email=email,
             # Membership info
-            member_type=member_type,
+            member_type_id=member_type_pk,
             status=status,
             expiration_date=expiration_date,
             # Dates
@@ -229,11 +367,15 @@ class Command(BaseCommand):
             date_joined=date_joined,
             date_inactivated=date_inactivated,
             # Contact info
-            home_address=row.get("home_address", "").strip(),
-            home_city=row.get("home_city", "").strip(),
-            home_state=row.get("home_state", "").strip(),
-            home_zip=row.get("home_zip", "").strip(),
-            home_phone=row.get("home_phone", "").strip(),
+            home_address=home_address,
+            home_city=home_city,
+            home_state=home_state,
+            home_zip=home_zip,
+            home_phone=home_phone,
         )
 
         return member
+
+    def row_data(self, row):
+        """Rebuild a column-name dict for a row (only needed for log entries)"""
+        return dict(zip(self.header, row))
@@ -2,10 +2,16 @@ import csv
 from pathlib import Path
 
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
 
 from members.models import PaymentMethod
 from .import_logger import ImportLogger
+from .import_utils import (
+    BatchInserter,
+    clear_tables,
+    import_transaction,
+    open_csv,
+    read_csv_header,
+)
 
 
 class Command(BaseCommand):
@@ -30,13 +36,14 @@ class Command(BaseCommand):
         if not csv_file.exists():
             raise CommandError(f"CSV file not found: {csv_file}")
 
-        if options["clear_existing"]:
-            self.stdout.write("🗑️  Clearing existing payment methods...")
-            PaymentMethod.objects.all().delete()
-            self.stdout.write("   ✅ Payment methods cleared")
-
         try:
-            with transaction.atomic():
+            with import_transaction():
+                # Cleared in the import transaction so a failed import rolls it back
+                if options["clear_existing"]:
+                    self.stdout.write("🗑️  Clearing existing payment methods...")
+                    clear_tables(PaymentMethod)
+                    self.stdout.write("   ✅ Payment methods cleared")
+
                 self.import_payment_methods(csv_file)
                 self.stdout.write(
                     self.style.SUCCESS(
@@ -52,46 +59,66 @@ class Command(BaseCommand):
         self.stdout.write(f"\n💳 Importing payment methods from: {csv_file}")
 
         # Initialize enhanced logger
-        logger = ImportLogger("import_payment_methods", csv_file)
-
-        with open(csv_file, "r", encoding="utf-8") as file:
-            reader = csv.DictReader(file)
-
-            for row_num, row in enumerate(reader, 2):  # Start at 2 (after header)
-                try:
-                    # Required field
-                    payment_method = row.get("payment_method", "").strip()
-                    if not payment_method:
-                        logger.log_error(row_num, "Missing payment_method", row)
+        with ImportLogger("import_payment_methods", csv_file) as logger:
+            # Load existing payment methods once instead of a get_or_create per row
+            existing = set(
+                PaymentMethod.objects.values_list("payment_method", flat=True)
+            )
+            # ignore_conflicts: a row inserted concurrently is skipped, not an error
+            inserter = BatchInserter(PaymentMethod, ignore_conflicts=True)
+
+            with open_csv(csv_file) as file:
+                reader = csv.reader(file)
+                header, columns = read_csv_header(reader, ("payment_method",))
+                payment_method_i = columns["payment_method"]
+
+                for row_num, row in enumerate(reader, 2):  # Start at 2 (after header)
+                    try:
+                        # Required field
+                        payment_method = row[payment_method_i].strip()
+                        if not payment_method:
+                            logger.log_error(
+                                row_num,
+                                "Missing payment_method",
+                                dict(zip(header, row)),
+                            )
+                            continue
+
+                        if payment_method in existing:
+                            logger.log_skipped(
+                                row_num,
+                                f"Payment method already exists: {payment_method}",
+                                dict(zip(header, row)),
+                            )
+                            if logger.skipped_count <= 5:
+                                self.stdout.write(f"   ⚠️  Exists: {payment_method}")
+                            continue
+
+                        payment_method_obj = PaymentMethod(
+                            payment_method=payment_method
+                        )
+                    except Exception as e:
+                        logger.log_error(
+                            row_num, f"Unexpected error - {e}", dict(zip(header, row))
+                        )
                         continue
 
-                    # Create or get payment method
-                    payment_method_obj, created = PaymentMethod.objects.get_or_create(
-                        payment_method=payment_method
-                    )
+                    # Outside the try: a failed batch insert aborts the import
+                    inserter.add(payment_method_obj)
+                    existing.add(payment_method)
 
-                    if created:
-                        logger.log_success(
-                            row_num,
-                            f"Created payment method: {payment_method}",
-                            payment_method_obj,
-                        )
-                        if logger.created_count <= 5:
-                            self.stdout.write(f"   ✅ Created: {payment_method_obj}")
-                    else:
-                        logger.log_skipped(
-                            row_num,
-                            f"Payment method already exists: {payment_method}",
-                            row,
-                        )
-                        if logger.skipped_count <= 5:
-                            self.stdout.write(f"   ⚠️  Exists: {payment_method_obj}")
+                    logger.log_success(
+                        row_num,
+                        f"Created payment method: {payment_method}",
+                        payment_method_obj,
+                    )
+                    if logger.created_count <= 5:
+                        self.stdout.write(f"   ✅ Created: {payment_method_obj}")
 
-                except Exception as e:
-                    logger.log_error(row_num, f"Unexpected error - {e}", row)
+            inserter.flush()
 
-        # Write detailed logs to files
-        logger.write_summary()
+            # Write detailed logs to files
+            logger.write_summary()
 
-        # Show console summary
-        logger.print_console_summary(self.stdout)
+            # Show console summary
+            logger.print_console_summary(self.stdout)
@@ -1,13 +1,37 @@
 import csv
-from decimal import Decimal
 from pathlib import Path
 
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
-from django.utils.dateparse import parse_date
+from django.db import connection
+from django.db.models import F
 
 from members.models import Member, PaymentMethod, Payment
 from .import_logger import ImportLogger
+from .import_utils import (
+    PROGRESS_INTERVAL,
+    BatchInserter,
+    clear_tables,
+    copy_available,
+    dropped_indexes,
+    import_transaction,
+    member_name_key,
+    open_csv,
+    parse_amount,
+    parse_csv_date,
+    parse_member_id,
+    read_ahead,
+    read_csv_header,
+)
+
+PAYMENT_COLUMNS = (
+    "member_id",
+    "first_name",
+    "last_name",
+    "payment_method",
+    "payment_amount",
+    "payment_date",
+    "receipt_number",
+)
 
 
 class Command(BaseCommand):
@@ -25,6 +49,16 @@ class Command(BaseCommand):
             action="store_true",
             help="Clear existing payments before import",
         )
+        parser.add_argument(
+            "--use-copy",
+            action="store_true",
+            help="Insert rows with PostgreSQL COPY (requires django-bulk-load)",
+        )
+        parser.add_argument(
+            "--rebuild-indexes",
+            action="store_true",
+            help="Drop secondary indexes during the load and rebuild them after (PostgreSQL)",
+        )
 
     def handle(self, *args, **options):
         csv_file = Path(options["csv_file"])
@@ -32,14 +66,28 @@ class Command(BaseCommand):
         if not csv_file.exists():
             raise CommandError(f"CSV file not found: {csv_file}")
 
-        if options["clear_existing"]:
-            self.stdout.write("🗑️  Clearing existing payments...")
-            Payment.objects.all().delete()
-            self.stdout.write("   ✅ Payments cleared")
+        self.use_copy = options["use_copy"] and copy_available()
+        if options["use_copy"] and not self.use_copy:
+            self.stdout.write(
+                "⚠️  COPY needs PostgreSQL and django-bulk-load - using bulk_create"
+            )
+
+        self.rebuild_indexes = options["rebuild_indexes"]
+        if self.rebuild_indexes and connection.vendor != "postgresql":
+            self.stdout.write(
+                "⚠️  --rebuild-indexes needs PostgreSQL - keeping indexes"
+            )
 
         try:
-            with transaction.atomic():
-                created_count = self.import_payments(csv_file)
+            with import_transaction():
+                # Cleared in the import transaction so a failed import rolls it back
+                if options["clear_existing"]:
+                    self.stdout.write("🗑️  Clearing existing payments...")
+                    clear_tables(Payment)
+                    self.stdout.write("   ✅ Payments cleared")
+
+                with dropped_indexes(Payment, self.rebuild_indexes):
+                    created_count = self.import_payments(csv_file)
                 self.stdout.write(
                     self.style.SUCCESS("\n✅ Payment import completed successfully!")
                 )
@@ -53,152 +101,208 @@ class Command(BaseCommand):
         self.stdout.write(f"\n💰 Importing payments from: {csv_file}")
 
         # Initialize enhanced logger
-        logger = ImportLogger("import_payments", csv_file)
-
-        with open(csv_file, "r", encoding="utf-8") as file:
-            reader = csv.DictReader(file)
-
-            for row_num, row in enumerate(reader, 2):  # Start at 2 (after header)
-                try:
-                    # Skip rows without payment data
-                    if not row.get("payment_amount") or not row.get("payment_date"):
-                        logger.log_skipped(
-                            row_num, "Missing payment_amount or payment_date", row
-                        )
-                        continue
-
-                    # 1. Find member by member_id first, then by name as fallback
-                    member = self.find_member(row, row_num, logger)
-                    if not member:
-                        continue
+        with ImportLogger("import_payments", csv_file) as logger:
+            inserter = BatchInserter(Payment, use_copy=self.use_copy)
 
-                    # 2. Find payment method
-                    payment_method = self.find_payment_method(row, row_num, logger)
-                    if not payment_method:
-                        continue
+            # Resolve foreign keys from in-memory maps instead of a query per row
+            self.member_pk_by_id = dict(
+                Member.objects.filter(member_id__isnull=False).values_list(
+                    "member_id", "pk"
+                )
+            )
+            # One member per case-insensitive name, preferring members with a
+            # member_id (active) over inactive namesakes
+            self.member_pk_by_name = {}
+            for first_name, last_name, pk in (
+                Member.objects.order_by(F("member_id").asc(nulls_last=True))
+                .values_list("first_name", "last_name", "pk")
+                .iterator()
+            ):
+                self.member_pk_by_name.setdefault(
+                    member_name_key(first_name, last_name), pk
+                )
+            self.payment_method_pk_by_name = {}
+            for pk, name in PaymentMethod.objects.values_list("pk", "payment_method"):
+                key = name.casefold()
+                if key in self.payment_method_pk_by_name:
+                    # Case-only variants would be ambiguous; the first one wins
+                    self.stdout.write(
+                        f"   ⚠️  Payment method '{name}' differs from another only by case - ignoring it"
+                    )
+                    continue
+                self.payment_method_pk_by_name[key] = pk
+
+            # (member, amount, date) of payments already stored or queued for insert
+            payment_keys = set(
+                Payment.objects.values_list("member_id", "amount", "date").iterator()
+            )
 
-                    # 3. Parse payment amount
+            with open_csv(csv_file) as file:
+                reader = csv.reader(file)
+                header, columns = read_csv_header(reader, PAYMENT_COLUMNS)
+
+                # Column positions as locals for the row loop
+                member_id_i = columns["member_id"]
+                first_name_i = columns["first_name"]
+                last_name_i = columns["last_name"]
+                method_i = columns["payment_method"]
+                amount_i = columns["payment_amount"]
+                date_i = columns["payment_date"]
+                receipt_i = columns["receipt_number"]
+
+                for row_num, row in enumerate(
+                    read_ahead(reader), 2
+                ):  # Row 1 is the header
+                    if row_num % PROGRESS_INTERVAL == 0:
+                        logger.print_progress(self.stdout)
                     try:
-                        amount = Decimal(str(row["payment_amount"]).strip())
-                    except (ValueError, TypeError):
-                        logger.log_error(
-                            row_num,
-                            f"Invalid payment amount '{row.get('payment_amount')}'",
-                            row,
-                        )
-                        continue
+                        raw_amount = row[amount_i]
+                        raw_date = row[date_i]
+
+                        # Skip rows without payment data
+                        if not raw_amount or not raw_date:
+                            logger.log_skipped(
+                                row_num,
+                                "Missing payment_amount or payment_date",
+                                dict(zip(header, row)),
+                            )
+                            continue
 
-                    # 4. Parse payment date
-                    payment_date = parse_date(row["payment_date"])
-                    if not payment_date:
-                        logger.log_error(
-                            row_num,
-                            f"Invalid payment date '{row.get('payment_date')}'",
-                            row,
+                        # 1. Find member by member_id first, then by name as fallback
+                        first_name = row[first_name_i].strip()
+                        last_name = row[last_name_i].strip()
+                        member_pk = self.find_member(
+                            row[member_id_i].strip(), first_name, last_name
                         )
-                        continue
+                        if not member_pk:
+                            logger.log_error(
+                                row_num,
+                                self.member_not_found_message(row, columns),
+                                dict(zip(header, row)),
+                            )
+                            continue
+
+                        # 2. Find payment method
+                        payment_method_name = row[method_i].strip()
+                        if not payment_method_name:
+                            logger.log_error(
+                                row_num,
+                                "Missing payment_method",
+                                dict(zip(header, row)),
+                            )
+                            continue
 
-                    # 5. Get receipt number (optional)
-                    receipt_number = row.get("receipt_number", "").strip()
+                        payment_method_pk = self.find_payment_method(
+                            payment_method_name
+                        )
+                        if not payment_method_pk:
+                            logger.log_error(
+                                row_num,
+                                f"Payment method '{payment_method_name}' not found",
+                                dict(zip(header, row)),
+                            )
+                            continue
+
+                        # 3. Parse payment amount
+                        amount = parse_amount(raw_amount)
+                        if amount is None:
+                            logger.log_error(
+                                row_num,
+                                f"Invalid payment amount '{raw_amount}'",
+                                dict(zip(header, row)),
+                            )
+                            continue
+
+                        # 4. Parse payment date
+                        payment_date = parse_csv_date(raw_date)
+                        if not payment_date:
+                            logger.log_error(
+                                row_num,
+                                f"Invalid payment date '{raw_date}'",
+                                dict(zip(header, row)),
+                            )
+                            continue
 
-                    # 6. Check for duplicate payments (same member, amount, date)
-                    existing_payment = Payment.objects.filter(
-                        member=member, amount=amount, date=payment_date
-                    ).first()
+                        # 5. Get receipt number (optional)
+                        receipt_number = row[receipt_i].strip()
 
-                    if existing_payment:
-                        logger.log_duplicate(
-                            row_num,
-                            f"Payment already exists: ${amount} on {payment_date} for {member.full_name}",
-                            row,
+                        # 6. Check for duplicate payments (same member, amount, date)
+                        payment_key = (member_pk, amount, payment_date)
+                        is_duplicate = payment_key in payment_keys
+                        description = (
+                            f"${amount} on {payment_date} for {first_name} {last_name}"
                         )
-                        if logger.duplicate_count <= 5:  # Show first 5 duplicates
-                            self.stdout.write(
-                                f"   ⚠️  Duplicate skipped: ${amount} on {payment_date} for {member.full_name}"
+
+                        if is_duplicate:
+                            logger.log_duplicate(
+                                row_num,
+                                f"Payment already exists: {description}",
+                                dict(zip(header, row)),
                             )
-                    else:
-                        # Create payment
-                        payment = Payment.objects.create(
-                            member=member,
-                            payment_method=payment_method,
+                            if logger.duplicate_count <= 5:  # Show first 5 duplicates
+                                self.stdout.write(
+                                    f"   ⚠️  Duplicate skipped: {description}"
+                                )
+                            continue
+
+                        payment = Payment(
+                            member_id=member_pk,
+                            payment_method_id=payment_method_pk,
                             amount=amount,
                             date=payment_date,
                             receipt_number=receipt_number,
                         )
-                        logger.log_success(
-                            row_num,
-                            f"Created payment: ${amount} on {payment_date} for {member.full_name}",
-                            payment,
+
+                    except Exception as e:
+                        logger.log_error(
+                            row_num, f"Unexpected error - {e}", dict(zip(header, row))
                         )
+                        continue
 
-                        if logger.created_count <= 5:  # Show first 5 created
-                            self.stdout.write(f"   ✅ Created: {payment}")
+                    # Queue payment for batched insert. Outside the try: a
+                    # failed batch insert aborts the import
+                    inserter.add(payment)
+                    payment_keys.add(payment_key)
+                    logger.log_success(
+                        row_num, f"Created payment: {description}", description
+                    )
 
-                except Exception as e:
-                    logger.log_error(row_num, f"Unexpected error - {e}", row)
+                    if logger.created_count <= 5:  # Show first 5 created
+                        self.stdout.write(f"   ✅ Created: {description}")
 
-        # Write detailed logs
-        logger.write_summary({"Total duplicates skipped": logger.duplicate_count})
-        logger.print_console_summary(self.stdout)
+            inserter.flush()
 
-        return logger.created_count
+            # Write detailed logs
+            logger.write_summary({"Total duplicates skipped": logger.duplicate_count})
+            logger.print_console_summary(self.stdout)
 
-    def find_member(self, row, row_num, logger):
-        """Find member by member_id first, then by name"""
-        member_id = row.get("member_id")
-        first_name = row.get("first_name", "").strip()
-        last_name = row.get("last_name", "").strip()
+        return logger.created_count
 
+    def find_member(self, member_id, first_name, last_name):
+        """Find a member's primary key by member_id first, then by name"""
         # Try to find by member_id first (for active members)
-        if member_id:
-            try:
-                member_id_int = int(member_id)
-                member = Member.objects.filter(member_id=member_id_int).first()
-                if member:
-                    return member
-            except (ValueError, TypeError):
-                pass
+        member_pk = self.member_pk_by_id.get(parse_member_id(member_id))
+        if member_pk:
+            return member_pk
 
         # Fallback to name lookup (for both active and inactive members)
         if first_name and last_name:
-            member = Member.objects.filter(
-                first_name__iexact=first_name, last_name__iexact=last_name
-            ).first()
+            return self.member_pk_by_name.get(member_name_key(first_name, last_name))
 
-            if member:
-                return member
+        return None
+
+    def member_not_found_message(self, row, columns):
+        """Describe a row whose member could not be matched"""
+        member_id = row[columns["member_id"]]
+        first_name = row[columns["first_name"]].strip()
+        last_name = row[columns["last_name"]].strip()
 
-        # Member not found
         error_msg = "Member not found - "
         if member_id:
             error_msg += f"ID: {member_id}, "
         error_msg += f"Name: {first_name} {last_name}"
-        logger.log_error(row_num, error_msg, row)
-        return None
+        return error_msg
 
-    def find_payment_method(self, row, row_num, logger):
-        """Find payment method by name"""
-        payment_method_name = row.get("payment_method", "").strip()
-
-        if not payment_method_name:
-            logger.log_error(row_num, "Missing payment_method", row)
-            return None
-
-        try:
-            payment_method = PaymentMethod.objects.get(
-                payment_method__iexact=payment_method_name
-            )
-            return payment_method
-        except PaymentMethod.DoesNotExist:
-            logger.log_error(
-                row_num,
-                f"Payment method '{payment_method_name}' not found",
-                row,
-            )
-            return None
-        except PaymentMethod.MultipleObjectsReturned:
-            # If multiple found, get the first one
-            payment_method = PaymentMethod.objects.filter(
-                payment_method__iexact=payment_method_name
-            ).first()
-            return payment_method
+    def find_payment_method(self, payment_method_name):
+        """Find a payment method's primary key by name (case-insensitive)"""
+        return self.payment_method_pk_by_name.get(payment_method_name.casefold())
@@ -0,0 +1,317 @@
+"""
+Shared helpers for the CSV import commands.
+Batches model instances so imports issue a handful of multi-row INSERTs
+instead of one INSERT per CSV row.
+"""
+
+import queue
+import re
+import threading
+from contextlib import contextmanager
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+
+from django.core.management.base import CommandError
+from django.db import connection, transaction
+from django.utils.dateparse import parse_date
+
+BATCH_SIZE = 1000
+
+# Print a running total every this many CSV rows
+PROGRESS_INTERVAL = 5000
+
+# Read CSVs in 1 MiB chunks instead of the default 8 KiB
+READ_BUFFER_SIZE = 1 << 20
+
+# Distinct amount strings remembered by parse_amount
+AMOUNT_CACHE_SIZE = 4096
+
+# Rows the background reader may parse ahead of the database writes
+READ_AHEAD_ROWS = 4096
+
+ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def copy_available():
+    """Return True when PostgreSQL COPY (via django-bulk-load) can be used"""
+    if connection.vendor != "postgresql":
+        return False
+    try:
+        import bulk_load  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def clear_tables(*models):
+    """
+    Delete every row of the given models' tables.
+
+    On PostgreSQL this is a single TRUNCATE, which avoids Django's
+    SELECT-then-DELETE collector. PostgreSQL only truncates a table that
+    another table references by foreign key if both are named in the same
+    statement, so tables referencing the cleared ones (directly or through
+    each other) are included. Like the PROTECT foreign keys, this raises
+    CommandError instead if any of those extra tables still has rows, so
+    clearing members never wipes payments. There is no CASCADE.
+    TRUNCATE skips the pre_delete/post_delete signals; nothing in the app
+    listens to them. It is transactional, so call it inside
+    import_transaction() to have a failed import restore the cleared rows.
+    Other databases use the ORM, deleting in the order given, so pass
+    dependent models first.
+    """
+    if connection.vendor != "postgresql":
+        for model in models:
+            model.objects.all().delete()
+        return
+
+    # Walk reverse foreign keys; models appended here are walked in turn
+    tables = list(models)
+    referencing = []
+    for model in tables:
+        for relation in model._meta.related_objects:
+            related_model = relation.related_model
+            if relation.many_to_many or related_model in tables:
+                continue
+            tables.append(related_model)
+            referencing.append(related_model)
+
+    for model in referencing:
+        if model.objects.exists():
+            cleared = ", ".join(
+                cleared_model._meta.db_table for cleared_model in models
+            )
+            raise CommandError(
+                f"Cannot clear {cleared}: {model._meta.db_table} still references it"
+            )
+
+    table_names = ", ".join(
+        connection.ops.quote_name(model._meta.db_table) for model in tables
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(f"TRUNCATE TABLE {table_names} RESTART IDENTITY")
+
+
+@contextmanager
+def import_transaction():
+    """
+    Atomic block for one import stage.
+
+    On PostgreSQL, deferrable constraints are checked once at COMMIT and the
+    COMMIT does not wait for the WAL flush (synchronous_commit = off). A crash
+    can lose the last stage's rows but never leaves them half-written, and
+    the imports skip existing rows, so a lost stage is simply rerun.
+    """
+    with transaction.atomic():
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET CONSTRAINTS ALL DEFERRED")
+                cursor.execute("SET LOCAL synchronous_commit = off")
+        yield
+
+
+@contextmanager
+def dropped_indexes(model, enabled=True):
+    """
+    Drop a model's Meta.indexes for a bulk load and rebuild them afterwards.
+
+    Building each index once over the loaded rows is cheaper than updating it
+    for every inserted row. PostgreSQL only, where DDL is transactional: use
+    it inside import_transaction() so a failed import gets its indexes back
+    with the rollback. Unique and foreign key indexes are left in place.
+    Does nothing when enabled is False.
+    """
+    if not enabled or connection.vendor != "postgresql":
+        yield
+        return
+    indexes = model._meta.indexes
+    with connection.schema_editor() as schema_editor:
+        for index in indexes:
+            schema_editor.remove_index(model, index)
+    yield
+    with connection.schema_editor() as schema_editor:
+        for index in indexes:
+            schema_editor.add_index(model, index)
+
+
+class BatchInserter:
+    """Collect unsaved model instances and write them with bulk_create"""
+
+    def __init__(
+        self, model, batch_size=BATCH_SIZE, use_copy=False, ignore_conflicts=False
+    ):
+        self.model = model
+        self.batch_size = batch_size
+        self.use_copy = use_copy
+        self.ignore_conflicts = ignore_conflicts
+        self.pending = []
+        self.inserted_count = 0
+
+    def add(self, instance):
+        """Queue an instance, flushing once a full batch has accumulated"""
+        self.pending.append(instance)
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write all queued instances to the database"""
+        if not self.pending:
+            return
+        if self.use_copy:
+            self._copy_insert()
+        else:
+            self.model.objects.bulk_create(
+                self.pending,
+                batch_size=self.batch_size,
+                ignore_conflicts=self.ignore_conflicts,
+            )
+        self.inserted_count += len(self.pending)
+        self.pending = []
+
+    def _copy_insert(self):
+        """Stream queued instances through PostgreSQL COPY FROM STDIN"""
+        from bulk_load import bulk_insert_models
+
+        # COPY skips Model.save(), so fill auto_now/auto_now_add timestamps here
+        timestamp_fields = [
+            field
+            for field in self.model._meta.concrete_fields
+            if getattr(field, "auto_now", False)
+            or getattr(field, "auto_now_add", False)
+        ]
+        for instance in self.pending:
+            for field in timestamp_fields:
+                field.pre_save(instance, add=True)
+
+        bulk_insert_models(self.pending)
+
+
+def open_csv(path):
+    """Open a CSV file as UTF-8 text for csv.reader, with a large read buffer"""
+    return open(path, "r", encoding="utf-8", newline="", buffering=READ_BUFFER_SIZE)
+
+
+def read_csv_header(reader, columns):
+    """
+    Read the header row from a csv.reader and map column names to positions.
+
+    Rows can then be read as plain lists instead of building a dict per row.
+    Raises CommandError if any of the expected columns is missing.
+    """
+    header = next(reader, [])
+    positions = {name: index for index, name in enumerate(header)}
+    missing = [name for name in columns if name not in positions]
+    if missing:
+        raise CommandError(f"CSV file is missing columns: {', '.join(missing)}")
+    return header, positions
+
+
+def parse_csv_date(value):
+    """
+    Parse a date from a CSV cell.
+
+    Cleaned CSVs use YYYY-MM-DD, which date.fromisoformat handles directly;
+    anything else falls back to Django's parse_date. Returns None for blank
+    or unparseable values and raises ValueError for impossible dates.
+    """
+    if value and ISO_DATE_RE.match(value):
+        return date.fromisoformat(value)
+    return parse_date(value)
+
+
+def parse_member_id(value):
+    """
+    Parse a member ID from a CSV cell.
+
+    A single int() call instead of isdigit() followed by int(). Returns None
+    for blank, non-numeric or negative values.
+    """
+    try:
+        member_id = int(value)
+    except (TypeError, ValueError):
+        return None
+    return member_id if member_id >= 0 else None
+
+
+def member_name_key(first_name, last_name):
+    """
+    Key for matching members by name regardless of case.
+
+    casefold() rather than lower() so names like "Strauß"/"STRAUSS" match.
+    """
+    return (first_name.casefold(), last_name.casefold())
+
+
+@lru_cache(maxsize=AMOUNT_CACHE_SIZE)
+def parse_amount(value):
+    """
+    Parse a currency amount from a CSV cell.
+
+    Decimal's constructor is implemented in C and ignores surrounding
+    whitespace, so it is used directly. Dues and payments repeat the same
+    few amounts, so results (immutable Decimals) are cached by cell text.
+    Returns None for blank, malformed or non-finite (NaN/Infinity) values.
+    """
+    try:
+        amount = Decimal(value)
+    except (InvalidOperation, TypeError):
+        return None
+    return amount if amount.is_finite() else None
+
+
+class _ReadError:
+    """Carries an exception from the reader thread to the consumer"""
+
+    def __init__(self, error):
+        self.error = error
+
+
+_END_OF_ROWS = object()
+
+
+def read_ahead(rows, maxsize=READ_AHEAD_ROWS):
+    """
+    Iterate over rows produced by a background thread.
+
+    File reads and CSV parsing happen in the thread while the caller builds
+    model instances and writes batches, so the two overlap. Database work
+    must stay in the calling thread. Errors raised while reading are
+    re-raised here.
+    """
+    rows_queue = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+
+    def put(item):
+        # Time out periodically so the thread exits if the consumer stops early
+        while not stop.is_set():
+            try:
+                rows_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for row in rows:
+                if not put(row):
+                    return
+        except Exception as e:
+            put(_ReadError(e))
+        else:
+            put(_END_OF_ROWS)
+
+    reader_thread = threading.Thread(target=produce, daemon=True)
+    reader_thread.start()
+    try:
+        while True:
+            item = rows_queue.get()
+            if item is _END_OF_ROWS:
+                return
+            if isinstance(item, _ReadError):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+        reader_thread.join()
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0002_fix_receipt_numbers'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='member',
+            index=models.Index(condition=models.Q(('status', 'active')), fields=['last_name', 'first_name'], name='member_active_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='member',
+            index=models.Index(condition=models.Q(('status', 'active')), fields=['member_id'], name='member_active_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='member',
+            index=models.Index(condition=models.Q(('status', 'active')), fields=['expiration_date'], name='member_active_expiration_idx'),
+        ),
+    ]
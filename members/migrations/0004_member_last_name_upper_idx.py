@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:20
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0003_member_active_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='member',
+            index=models.Index(django.db.models.functions.text.Upper('last_name'), name='member_last_name_upper_idx'),
+        ),
+    ]
@@ -1,5 +1,6 @@
 import uuid
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils import timezone
 
 
@@ -248,6 +249,25 @@ class Member(models.Model):
             models.Index(fields=["last_name", "first_name"]),
             models.Index(fields=["status"]),
             models.Index(fields=["expiration_date"]),
+            # Case-insensitive last name ranges (alphabet browsing on search)
+            models.Index(Upper("last_name"), name="member_last_name_upper_idx"),
+            # Partial indexes for the active-member lists and reports, which
+            # filter on status="active" and sort by name, ID or expiration
+            models.Index(
+                fields=["last_name", "first_name"],
+                name="member_active_name_idx",
+                condition=models.Q(status="active"),
+            ),
+            models.Index(
+                fields=["member_id"],
+                name="member_active_id_idx",
+                condition=models.Q(status="active"),
+            ),
+            models.Index(
+                fields=["expiration_date"],
+                name="member_active_expiration_idx",
+                condition=models.Q(status="active"),
+            ),
         ]
 
     def __str__(self):
@@ -1,26 +1,95 @@
+from django.db.models import Q
 from django.http import HttpResponse
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font
-from io import BytesIO
 from datetime import date
 
-
-def generate_newsletter_excel(members_queryset):
-    """Generate Excel export of active members for newsletter distribution"""
-
-    # Split members into groups
-    members_with_email = []
-    members_without_email = []
-
-    for member in members_queryset:
-        if member.email and member.email.strip():
-            members_with_email.append(member)
-        else:
-            members_without_email.append(member)
+BOLD = Font(bold=True)
+
+# Members with email per numbered newsletter sheet
+NEWSLETTER_ROWS_PER_SHEET = 99
+
+# Rows fetched per database round trip while streaming the newsletter export
+NEWSLETTER_CHUNK_SIZE = 500
+
+# An email that is not blank or whitespace-only (the old email.strip() test)
+HAS_EMAIL = Q(email__isnull=False) & ~Q(email__regex=r"^\s*$")
+
+# The only Member columns the newsletter export reads
+NEWSLETTER_FIELDS = (
+    "member_id",
+    "first_name",
+    "last_name",
+    "email",
+    "date_joined",
+    "milestone_date",
+    "expiration_date",
+)
+
+# Member columns read by the other exports; views pass them to .only()
+NEW_MEMBER_FIELDS = NEWSLETTER_FIELDS + (
+    "home_address",
+    "home_city",
+    "home_state",
+    "home_zip",
+    "home_phone",
+)
+MILESTONE_FIELDS = NEWSLETTER_FIELDS
+EXPIRES_TWO_MONTHS_FIELDS = NEWSLETTER_FIELDS
+
+
+def format_date(d):
+    """Format a date as MM/DD/YYYY, or "" when there is no date"""
+    # Built from the date fields: faster than strftime, which parses the format each call
+    if d:
+        return f"{d.month:02d}/{d.day:02d}/{d.year:04d}"
+    return ""
+
+
+def _header_cells(ws, headers):
+    """
+    Build bold write-only cells for a header row.
+
+    Appending positions each cell again, so one list can be reused as the
+    header of every sheet in the same workbook.
+    """
+    cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.font = BOLD
+        cells.append(cell)
+    return cells
+
+
+def _append_header(ws, headers):
+    """Append a bold header row to a write-only worksheet"""
+    ws.append(_header_cells(ws, headers))
+
+
+def generate_newsletter_excel(
+    members_queryset, rows_per_sheet=NEWSLETTER_ROWS_PER_SHEET
+):
+    """
+    Generate Excel export of active members for newsletter distribution
+
+    Members with email are split into numbered sheets of rows_per_sheet
+    members; pass None to put them all on a single sheet.
+    """
+
+    # Split members into groups in the database, as plain dicts of the
+    # exported columns; each group is streamed rather than held in memory
+    member_rows = members_queryset.values(*NEWSLETTER_FIELDS)
+    members_with_email = member_rows.filter(HAS_EMAIL).iterator(
+        chunk_size=NEWSLETTER_CHUNK_SIZE
+    )
+    members_without_email = member_rows.exclude(HAS_EMAIL).iterator(
+        chunk_size=NEWSLETTER_CHUNK_SIZE
+    )
 
     # Create workbook
-    wb = Workbook()
-    wb.remove(wb.active)  # Remove default sheet
+    # Write-only mode streams rows out instead of keeping every cell in memory
+    wb = Workbook(write_only=True)
 
     # Column headers
     headers = [
@@ -35,92 +104,71 @@ def generate_newsletter_excel(members_queryset):
         "FullName",
     ]
 
-    # Helper function to format date
-    def format_date(d):
-        if d:
-            return d.strftime("%m/%d/%Y")
-        return ""
-
-    # Helper function to write member row
-    def write_member_row(ws, member, row_num):
+    # Helper function to write member row (a dict from .values())
+    def write_member_row(ws, member):
+        email = member["email"]
+        full_name = f"{member['first_name']} {member['last_name']}"
         mail_name = ""
-        if member.email and member.email.strip():
-            mail_name = f"{member.first_name} {member.last_name}<{member.email}>"
+        if email and email.strip():
+            mail_name = f"{full_name}<{email}>"
 
         ws.append(
-            [
-                member.member_id or "",
-                member.first_name,
-                member.last_name,
-                member.email or "",
-                format_date(member.date_joined),
-                format_date(member.milestone_date),
-                format_date(member.expiration_date),
+            (
+                member["member_id"] or "",
+                member["first_name"],
+                member["last_name"],
+                email or "",
+                format_date(member["date_joined"]),
+                format_date(member["milestone_date"]),
+                format_date(member["expiration_date"]),
                 mail_name,
-                f"{member.first_name} {member.last_name}",
-            ]
+                full_name,
+            )
         )
 
-    # Create numbered sheets for members with emails (99 per sheet)
-    if members_with_email:
-        sheet_num = 1
-        current_sheet = None
-        row_count = 0
-
-        for member in members_with_email:
-            # Create new sheet if needed (every 99 rows)
-            if row_count == 0:
-                current_sheet = wb.create_sheet(title=f"Sheet {sheet_num}")
-                # Write headers
-                current_sheet.append(headers)
-                # Make headers bold
-                for cell in current_sheet[1]:
-                    cell.font = Font(bold=True)
-                row_count = 1
-
-            # Write member row
-            write_member_row(current_sheet, member, row_count + 1)
-            row_count += 1
-
-            # Start new sheet if we've reached 99 members
-            if row_count > 99:
-                sheet_num += 1
-                row_count = 0
-
-    # Create "No Email" sheet
-    if members_without_email:
-        no_email_sheet = wb.create_sheet(title="No Email")
-        # Write headers
-        no_email_sheet.append(headers)
-        # Make headers bold
-        for cell in no_email_sheet[1]:
-            cell.font = Font(bold=True)
-
-        # Write all members without emails
-        for member in members_without_email:
-            write_member_row(no_email_sheet, member, 0)
+    # Bold header cells, built for the first sheet and reused on the rest
+    header_cells = None
+
+    # Helper function to start a sheet with a frozen bold header row
+    def create_sheet(title):
+        nonlocal header_cells
+        ws = wb.create_sheet(title=title)
+        ws.freeze_panes = "A2"
+        if header_cells is None:
+            header_cells = _header_cells(ws, headers)
+        ws.append(header_cells)
+        return ws
+
+    # Create numbered sheets for members with emails (rows_per_sheet per sheet)
+    current_sheet = None
+    for index, member in enumerate(members_with_email):
+        if current_sheet is None or (rows_per_sheet and index % rows_per_sheet == 0):
+            sheet_num = index // rows_per_sheet + 1 if rows_per_sheet else 1
+            current_sheet = create_sheet(f"Sheet {sheet_num}")
+        write_member_row(current_sheet, member)
+
+    # Create "No Email" sheet, once the first member without email turns up
+    no_email_sheet = None
+    for member in members_without_email:
+        if no_email_sheet is None:
+            no_email_sheet = create_sheet("No Email")
+        write_member_row(no_email_sheet, member)
 
     # Ensure at least one sheet exists (for empty queryset case)
     if len(wb.sheetnames) == 0:
-        empty_sheet = wb.create_sheet(title="Sheet 1")
-        empty_sheet.append(headers)
-        for cell in empty_sheet[1]:
-            cell.font = Font(bold=True)
-
-    # Save to BytesIO buffer
-    buffer = BytesIO()
-    wb.save(buffer)
-    buffer.seek(0)
+        create_sheet("Sheet 1")
 
     # Create HTTP response
     response = HttpResponse(
-        buffer.getvalue(),
         content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
     )
     response["Content-Disposition"] = (
         f'attachment; filename="newsletter_data_{date.today().strftime("%Y_%m_%d")}.xlsx"'
     )
 
+    # Save straight into the response instead of copying out of a buffer
+    wb.save(response)
+
     return response
 
 
@@ -138,8 +186,8 @@ def generate_new_member_excel(members_queryset):
             members_without_email.append(member)
 
     # Create workbook
-    wb = Workbook()
-    wb.remove(wb.active)  # Remove default sheet
+    # Write-only mode streams rows out instead of keeping every cell in memory
+    wb = Workbook(write_only=True)
 
     # Column headers (in order as specified - exact formatting for template)
     headers = [
@@ -159,12 +207,6 @@ def generate_new_member_excel(members_queryset):
         "MailName",
     ]
 
-    # Helper function to format date
-    def format_date(d):
-        if d:
-            return d.strftime("%m/%d/%Y")
-        return ""
-
     # Helper function to extract first 5 digits of zip
     def extract_zip5(zip_str):
         if zip_str:
@@ -227,11 +269,8 @@ def generate_new_member_excel(members_queryset):
     # Create main sheet(s) for members with emails (no 99-row limit)
     if members_with_email:
         main_sheet = wb.create_sheet(title="New Members")
-        # Write headers
-        main_sheet.append(headers)
-        # Make headers bold
-        for cell in main_sheet[1]:
-            cell.font = Font(bold=True)
+        # Write bold headers
+        _append_header(main_sheet, headers)
 
         # Write all members with emails
         for member in members_with_email:
@@ -240,11 +279,8 @@ def generate_new_member_excel(members_queryset):
     # Create "no email" sheet if any members lack emails
     if members_without_email:
         no_email_sheet = wb.create_sheet(title="no email")
-        # Write headers
-        no_email_sheet.append(headers)
-        # Make headers bold
-        for cell in no_email_sheet[1]:
-            cell.font = Font(bold=True)
+        # Write bold headers
+        _append_header(no_email_sheet, headers)
 
         # Write all members without emails
         for member in members_without_email:
@@ -253,24 +289,19 @@ def generate_new_member_excel(members_queryset):
     # Ensure at least one sheet exists (for empty queryset case)
     if len(wb.sheetnames) == 0:
         empty_sheet = wb.create_sheet(title="New Members")
-        empty_sheet.append(headers)
-        for cell in empty_sheet[1]:
-            cell.font = Font(bold=True)
-
-    # Save to BytesIO buffer
-    buffer = BytesIO()
-    wb.save(buffer)
-    buffer.seek(0)
+        _append_header(empty_sheet, headers)
 
     # Create HTTP response
     response = HttpResponse(
-        buffer.getvalue(),
         content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
     )
     response["Content-Disposition"] = (
         f'attachment; filename="new_members_{date.today().strftime("%Y_%m_%d")}.xlsx"'
     )
 
+    # Save straight into the response instead of copying out of a buffer
+    wb.save(response)
+
     return response
 
 
@@ -288,8 +319,8 @@ def generate_milestone_excel(members_queryset):
             members_without_email.append(member)
 
     # Create workbook
-    wb = Workbook()
-    wb.remove(wb.active)  # Remove default sheet
+    # Write-only mode streams rows out instead of keeping every cell in memory
+    wb = Workbook(write_only=True)
 
     # Column headers (in order, 11 columns total)
     headers = [
@@ -306,12 +337,6 @@ def generate_milestone_excel(members_queryset):
         "Jyear",
     ]
 
-    # Helper function to format date
-    def format_date(d):
-        if d:
-            return d.strftime("%m/%d/%Y")
-        return ""
-
     # Helper function to calculate years (current_year - milestone_year)
     def calculate_years(milestone_date):
         if milestone_date:
@@ -411,11 +436,8 @@ def generate_milestone_excel(members_queryset):
     # Create main sheet(s) for members with emails (no row limit)
     if members_with_email:
         main_sheet = wb.create_sheet(title="Milestone Export")
-        # Write headers
-        main_sheet.append(headers)
-        # Make headers bold
-        for cell in main_sheet[1]:
-            cell.font = Font(bold=True)
+        # Write bold headers
+        _append_header(main_sheet, headers)
 
         # Write all members with emails
         for member in members_with_email:
@@ -424,11 +446,8 @@ def generate_milestone_excel(members_queryset):
     # Create "no email" sheet if any members lack emails
     if members_without_email:
         no_email_sheet = wb.create_sheet(title="no email")
-        # Write headers
-        no_email_sheet.append(headers)
-        # Make headers bold
-        for cell in no_email_sheet[1]:
-            cell.font = Font(bold=True)
+        # Write bold headers
+        _append_header(no_email_sheet, headers)
 
         # Write all members without emails
         for member in members_without_email:
@@ -437,24 +456,19 @@ def generate_milestone_excel(members_queryset):
     # Ensure at least one sheet exists (for empty queryset case)
     if len(wb.sheetnames) == 0:
         empty_sheet = wb.create_sheet(title="Milestone Export")
-        empty_sheet.append(headers)
-        for cell in empty_sheet[1]:
-            cell.font = Font(bold=True)
-
-    # Save to BytesIO buffer
-    buffer = BytesIO()
-    wb.save(buffer)
-    buffer.seek(0)
+        _append_header(empty_sheet, headers)
 
     # Create HTTP response
     response = HttpResponse(
-        buffer.getvalue(),
         content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
     )
     response["Content-Disposition"] = (
         f'attachment; filename="milestone_export_{date.today().strftime("%Y_%m_%d")}.xlsx"'
     )
 
+    # Save straight into the response instead of copying out of a buffer
+    wb.save(response)
+
     return response
 
 
@@ -472,8 +486,8 @@ def generate_expires_two_months_excel(members_queryset):
             members_without_email.append(member)
 
     # Create workbook
-    wb = Workbook()
-    wb.remove(wb.active)  # Remove default sheet
+    # Write-only mode streams rows out instead of keeping every cell in memory
+    wb = Workbook(write_only=True)
 
     # Column headers (in order, 7 columns total)
     headers = [
@@ -486,12 +500,6 @@ def generate_expires_two_months_excel(members_queryset):
         "Expires",
     ]
 
-    # Helper function to format date
-    def format_date(d):
-        if d:
-            return d.strftime("%m/%d/%Y")
-        return ""
-
     # Helper function to create mail name
     def create_mail_name(member):
         if member.email and member.email.strip():
@@ -515,11 +523,8 @@ def generate_expires_two_months_excel(members_queryset):
     # Create main sheet(s) for members with emails
     if members_with_email:
         main_sheet = wb.create_sheet(title="Expires Two Months")
-        # Write headers
-        main_sheet.append(headers)
-        # Make headers bold
-        for cell in main_sheet[1]:
-            cell.font = Font(bold=True)
+        # Write bold headers
+        _append_header(main_sheet, headers)
 
         # Write all members with emails
         for member in members_with_email:
@@ -528,11 +533,8 @@ def generate_expires_two_months_excel(members_queryset):
     # Create "no email" sheet if any members lack emails
     if members_without_email:
         no_email_sheet = wb.create_sheet(title="No Email")
-        # Write headers
-        no_email_sheet.append(headers)
-        # Make headers bold
-        for cell in no_email_sheet[1]:
-            cell.font = Font(bold=True)
+        # Write bold headers
+        _append_header(no_email_sheet, headers)
 
         # Write all members without emails
         for member in members_without_email:
@@ -541,22 +543,17 @@ def generate_expires_two_months_excel(members_queryset):
     # Ensure at least one sheet exists (for empty queryset case)
     if len(wb.sheetnames) == 0:
         empty_sheet = wb.create_sheet(title="Expires Two Months")
-        empty_sheet.append(headers)
-        for cell in empty_sheet[1]:
-            cell.font = Font(bold=True)
-
-    # Save to BytesIO buffer
-    buffer = BytesIO()
-    wb.save(buffer)
-    buffer.seek(0)
+        _append_header(empty_sheet, headers)
 
     # Create HTTP response
     response = HttpResponse(
-        buffer.getvalue(),
         content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
     )
     response["Content-Disposition"] = (
         f'attachment; filename="expires_two_months_{date.today().strftime("%Y_%m_%d")}.xlsx"'
     )
 
+    # Save straight into the response instead of copying out of a buffer
+    wb.save(response)
+
     return response
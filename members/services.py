@@ -7,6 +7,8 @@ for member and payment operations, separating concerns from views.
 
 from decimal import Decimal
 from datetime import datetime, date
+from django.db import transaction
+from django.utils import timezone
 from .models import Member, MemberType, Payment, PaymentMethod
 from .utils import add_months_to_date, ensure_end_of_month
 
@@ -31,12 +33,23 @@ class PaymentService:
             return override_expiration
 
         if member.member_type and member.member_type.member_dues > 0:
-            months_paid = float(payment_amount) / float(member.member_type.member_dues)
-            total_months_to_add = int(months_paid)
+            total_months_to_add = PaymentService._months_paid(
+                payment_amount, member.member_type.member_dues
+            )
             return add_months_to_date(member.expiration_date, total_months_to_add)
         else:
             return add_months_to_date(member.expiration_date, 1)
 
+    @staticmethod
+    def _months_paid(payment_amount, member_dues):
+        """
+        Whole months of dues covered by a payment.
+
+        Floor division in Decimal, with no float round trip, so amounts like
+        0.30 / 0.10 come out exact instead of as 2.999...
+        """
+        return int(Decimal(str(payment_amount)) // Decimal(str(member_dues)))
+
     @staticmethod
     def calculate_suggested_payment_for_new_member(member_type, start_date=None):
         """
@@ -97,8 +110,9 @@ class PaymentService:
         current_month_end = ensure_end_of_month(start_date)
 
         if member_type and member_type.member_dues > 0:
-            months_paid = float(payment_amount) / float(member_type.member_dues)
-            total_months_to_add = int(months_paid)
+            total_months_to_add = PaymentService._months_paid(
+                payment_amount, member_type.member_dues
+            )
 
             # If payment is less than 1 month, still give them until end of current month
             if total_months_to_add == 0:
@@ -123,14 +137,60 @@ class PaymentService:
                 - payment_date: Payment date (ISO format string)
                 - receipt_number: Receipt number (string)
                 - new_expiration: New expiration date (ISO format string)
+                - current_expiration: Optional expiration date (ISO format
+                  string) that new_expiration was calculated from
+
+        The member is updated with a conditional UPDATE that only matches while
+        the row still has the expiration (current_expiration, else the
+        member's) and status the payment was based on, so the row is not read
+        first. If another payment got there first, the row is locked and
+        re-read, and new_expiration is recalculated if current_expiration no
+        longer matches it.
 
         Returns:
             tuple: (payment_instance, was_reactivated_bool)
         """
         payment_method = PaymentMethod.objects.get(pk=payment_data["payment_method_id"])
 
-        # Create payment
-        payment = Payment.objects.create(
+        current_expiration = payment_data.get("current_expiration")
+        seen_expiration = (
+            date.fromisoformat(current_expiration)
+            if current_expiration
+            else member.expiration_date
+        )
+        seen_status = member.status
+
+        # One transaction (and one commit) for the payment and the member update
+        with transaction.atomic():
+            was_inactive = PaymentService._apply_payment_to_member(member, payment_data)
+            member.updated_at = timezone.now()
+            changes = {
+                "expiration_date": member.expiration_date,
+                "updated_at": member.updated_at,
+            }
+            if was_inactive:
+                changes.update(status=member.status, date_inactivated=None)
+            updated = Member.objects.filter(
+                pk=member.pk, expiration_date=seen_expiration, status=seen_status
+            ).update(**changes)
+
+            if not updated:
+                payment_data, was_inactive = PaymentService._apply_payment_to_locked(
+                    member, payment_data
+                )
+
+            # Create payment (its post_save clears the cached search stats)
+            payment = PaymentService._build_payment(
+                member, payment_method, payment_data
+            )
+            payment.save()
+
+        return payment, was_inactive
+
+    @staticmethod
+    def _build_payment(member, payment_method, payment_data):
+        """Build an unsaved Payment from process_payment's payment_data"""
+        return Payment(
             member=member,
             payment_method=payment_method,
             amount=Decimal(payment_data["amount"]),
@@ -138,6 +198,52 @@ class PaymentService:
             receipt_number=payment_data["receipt_number"],
         )
 
+    @staticmethod
+    def _apply_payment_to_locked(member, payment_data):
+        """
+        Lock and re-read the member row, then apply and save the payment.
+
+        Fallback for process_payment when the row changed since the payment
+        was calculated. Returns (payment_data, was_inactive); payment_data is
+        a copy with a recalculated new_expiration if current_expiration is
+        stale.
+        """
+        locked = (
+            Member.objects.select_for_update()
+            .only("expiration_date", "status", "date_inactivated")
+            .get(pk=member.pk)
+        )
+        member.expiration_date = locked.expiration_date
+        member.status = locked.status
+        member.date_inactivated = locked.date_inactivated
+
+        current_expiration = payment_data.get("current_expiration")
+        if (
+            current_expiration
+            and date.fromisoformat(current_expiration) != member.expiration_date
+        ):
+            new_expiration = PaymentService.calculate_expiration(
+                member, Decimal(payment_data["amount"])
+            )
+            payment_data = {
+                **payment_data,
+                "new_expiration": new_expiration.isoformat(),
+            }
+
+        was_inactive = PaymentService._apply_payment_to_member(member, payment_data)
+        member.save(
+            update_fields=[
+                "expiration_date",
+                "status",
+                "date_inactivated",
+                "updated_at",
+            ]
+        )
+        return payment_data, was_inactive
+
+    @staticmethod
+    def _apply_payment_to_member(member, payment_data):
+        """Set the member's new expiration, reactivating if inactive (unsaved)"""
         # Update member expiration
         member.expiration_date = datetime.fromisoformat(
             payment_data["new_expiration"]
@@ -149,9 +255,7 @@ class PaymentService:
             member.status = "active"
             member.date_inactivated = None
 
-        member.save()
-
-        return payment, was_inactive
+        return was_inactive
 
 
 class MemberService:
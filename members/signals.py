@@ -0,0 +1,29 @@
+"""
+Signal receivers for the members app.
+
+Saving a member or payment clears the cached search page stats, but only in
+the saving process: CACHES is unset, so every gunicorn worker has its own
+LocMemCache, and the other workers keep serving their copy until it expires.
+SEARCH_STATS_TIMEOUT is therefore the real bound on how stale the stats can
+be; the receiver just refreshes the worker that handled the save at once.
+Deletes and bulk writes (imports) send no post_save and are also left to the
+timeout; a post_delete receiver would stop Django from fast-deleting rows.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import Member, Payment
+
+# Cache key and lifetime (seconds) for the search page stats; the lifetime is
+# how long other workers may show counts from before a save
+SEARCH_STATS_CACHE_KEY = "search_stats_v1"
+SEARCH_STATS_TIMEOUT = 60
+
+
+@receiver(post_save, sender=Member)
+@receiver(post_save, sender=Payment)
+def clear_search_stats(sender, **kwargs):
+    """Drop the cached search stats so the next search page recounts"""
+    cache.delete(SEARCH_STATS_CACHE_KEY)
@@ -5,6 +5,10 @@ These functions handle date manipulation for membership expiration dates.
 """
 
 import calendar
+from functools import lru_cache
+
+# Distinct (date, months) pairs remembered by add_months_to_date
+ADD_MONTHS_CACHE_SIZE = 4096
 
 
 def ensure_end_of_month(date_obj):
@@ -13,6 +17,7 @@ def ensure_end_of_month(date_obj):
     return date_obj.replace(day=last_day)
 
 
+@lru_cache(maxsize=ADD_MONTHS_CACHE_SIZE)
 def add_months_to_date(date_obj, months):
     """Add months to a date and return the last day of the resulting month
 
@@ -22,6 +27,7 @@ def add_months_to_date(date_obj, months):
     - Current expiration: Dec 15, 2024 + 2 months = Feb 29, 2025
 
     This ensures all memberships expire at the end of the month regardless of payment date.
+    Results are cached: expirations cluster on a few month-end dates.
     """
     # Calculate the target year and month
     month = date_obj.month - 1 + months
@@ -3,7 +3,7 @@ Views for database backup functionality.
 """
 
 import os
-from django.http import HttpResponse
+from django.http import FileResponse, HttpResponse
 from django.contrib.admin.views.decorators import staff_member_required
 from members.backup_utils import create_backup
 
@@ -13,8 +13,10 @@ def download_backup_view(request):
     """
     Create and immediately download database backup.
 
-    Creates a temporary backup file, reads it into memory, deletes it,
-    and streams it to the user's browser as a download.
+    Creates a temporary backup file, opens it, deletes it (with its checksum
+    file) and streams it to the user's browser as a download. The open handle
+    keeps the deleted file readable until the response closes it, so the
+    backup is sent in chunks instead of being read into memory.
     """
     result = create_backup()
 
@@ -23,25 +25,32 @@ def download_backup_view(request):
             f"Backup failed: {result['error']}", status=500, content_type="text/plain"
         )
 
-    # Read the backup file content
+    backup_file = None
     try:
-        with open(result["filepath"], "rb") as f:
-            file_content = f.read()
+        backup_file = open(result["filepath"], "rb")
 
-        # Delete the temporary file (cleanup)
+        # Delete the temporary files (cleanup)
         os.unlink(result["filepath"])
-
-        # Create HTTP response with file download
-        response = HttpResponse(file_content, content_type="application/json")
-        response["Content-Disposition"] = f'attachment; filename="{result["filename"]}"'
-
-        return response
+        if result.get("checksum_filepath"):
+            os.unlink(result["checksum_filepath"])
+
+        # Stream the file download; FileResponse closes the handle when done
+        return FileResponse(
+            backup_file,
+            as_attachment=True,
+            filename=result["filename"],
+            content_type="application/gzip",
+        )
 
     except Exception as e:
+        if backup_file:
+            backup_file.close()
+
         # Try to clean up file if it exists
         try:
-            if result.get("filepath") and os.path.exists(result["filepath"]):
-                os.unlink(result["filepath"])
+            for path in (result.get("filepath"), result.get("checksum_filepath")):
+                if path and os.path.exists(path):
+                    os.unlink(path)
         except Exception:
             pass
 
@@ -50,4 +59,3 @@ def download_backup_view(request):
             status=500,
             content_type="text/plain",
         )
-
@@ -35,11 +35,18 @@ def reactivate_member_view(request, member_uuid):
 @login_required
 def member_detail_view(request, member_uuid):
     """Member detail page with payment history and optional date filtering"""
-    member = get_object_or_404(Member, member_uuid=member_uuid)
+    # member_type is shown on the page, so load it in the same query
+    member = get_object_or_404(
+        Member.objects.select_related("member_type"), member_uuid=member_uuid
+    )
 
-    # Get payment history with optional date filtering
+    # Get payment history with optional date filtering. created_at breaks ties
+    # between same-day payments so pages never repeat or skip a row; the
+    # (member, date) index serves the filter and sort
     payments_queryset = (
-        member.payments.all().select_related("payment_method").order_by("-date")
+        member.payments.all()
+        .select_related("payment_method")
+        .order_by("-date", "-created_at")
     )
 
     # Apply date filters if provided
@@ -70,7 +77,7 @@ def member_detail_view(request, member_uuid):
         "payments": payments,
         "start_date": start_date,
         "end_date": end_date,
-        "total_payments": payments_queryset.count(),
+        "total_payments": paginator.count,  # Already counted by the paginator
     }
 
     return render(request, "members/member_detail.html", context)
@@ -83,13 +90,13 @@ def edit_member_view(request, member_uuid=None):
         query = request.GET.get("q", "").strip()
         members = None
         if query:
-            try:
+            if query.isdecimal():
                 members = (
                     Member.objects.filter(status="active", member_id=int(query))
                     .select_related("member_type")
                     .order_by("last_name", "first_name")
                 )
-            except ValueError:
+            else:
                 members = (
                     Member.objects.filter(status="active")
                     .filter(
@@ -20,9 +20,10 @@ def add_payment_view(request):
     # If member UUID is provided, skip search and go to form
     if member_uuid and step == "search":
         try:
-            member = get_object_or_404(Member, member_uuid=member_uuid)
-            # Redirect to form step with the member
-            return redirect(f"{request.path}?step=form&member={member_uuid}")
+            # Only existence matters here; the form step loads the member
+            if Member.objects.filter(member_uuid=member_uuid).exists():
+                # Redirect to form step with the member
+                return redirect(f"{request.path}?step=form&member={member_uuid}")
         except:  # noqa: E722
             # If invalid UUID, continue with search
             pass
@@ -33,13 +34,14 @@ def add_payment_view(request):
         members = None
 
         if query:
-            try:
-                # Try to parse as member ID
-                member_id = int(query)
-                members = Member.objects.filter(member_id=member_id).exclude(
-                    status="deceased"
+            if query.isdecimal():
+                # Search by member ID
+                members = (
+                    Member.objects.filter(member_id=int(query))
+                    .exclude(status="deceased")
+                    .select_related("member_type")
                 )
-            except ValueError:
+            else:
                 # Search by name
                 members = (
                     Member.objects.filter(
@@ -63,7 +65,9 @@ def add_payment_view(request):
             messages.error(request, "Please select a member first.")
             return redirect("members:add_payment")
 
-        member = get_object_or_404(Member, member_uuid=member_uuid)
+        member = get_object_or_404(
+            Member.objects.select_related("member_type"), member_uuid=member_uuid
+        )
 
         # Don't allow payments for deceased members
         if member.status == "deceased":
@@ -108,7 +112,10 @@ def add_payment_view(request):
 
             # Validate form data
             try:
-                member = get_object_or_404(Member, member_uuid=member_uuid)
+                member = get_object_or_404(
+                    Member.objects.select_related("member_type"),
+                    member_uuid=member_uuid,
+                )
 
                 # Don't allow payments for deceased members
                 if member.status == "deceased":
@@ -146,7 +153,7 @@ def add_payment_view(request):
                 )
 
                 # Store in session for final processing
-                request.session["payment_data"] = {
+                payment_data = {
                     "member_uuid": str(member_uuid),
                     "amount": str(amount),
                     "payment_date": payment_date.isoformat(),
@@ -154,6 +161,12 @@ def add_payment_view(request):
                     "receipt_number": receipt_number,
                     "new_expiration": new_expiration.isoformat(),
                 }
+                if not override_expiration_date:
+                    # Lets process_payment recalculate if another payment lands first
+                    payment_data["current_expiration"] = (
+                        member.expiration_date.isoformat()
+                    )
+                request.session["payment_data"] = payment_data
 
                 context = {
                     "step": "confirm",
@@ -190,7 +203,8 @@ def add_payment_view(request):
             try:
                 # Get member and process payment using PaymentService
                 member = get_object_or_404(
-                    Member, member_uuid=payment_data["member_uuid"]
+                    Member.objects.select_related("member_type"),
+                    member_uuid=payment_data["member_uuid"],
                 )
 
                 # Check if override expiration was changed on confirmation page
@@ -213,6 +227,7 @@ def add_payment_view(request):
                     )
                     # Update payment_data with new expiration
                     payment_data["new_expiration"] = new_expiration.isoformat()
+                    payment_data.pop("current_expiration", None)
 
                 # Process payment using PaymentService
                 payment, was_inactive = PaymentService.process_payment(
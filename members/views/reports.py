@@ -3,10 +3,19 @@ from django.db.models import Prefetch
 from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib import messages
 from django.db import transaction
+from collections import deque
 from datetime import date, timedelta
 
 from ..models import Member, Payment
-from ..reports.excel import generate_expires_two_months_excel
+from ..reports.excel import (
+    EXPIRES_TWO_MONTHS_FIELDS,
+    MILESTONE_FIELDS,
+    NEW_MEMBER_FIELDS,
+    generate_expires_two_months_excel,
+)
+
+# Most deactivation errors shown as individual messages; the rest are counted
+MAX_DEACTIVATION_ERRORS = 10
 
 
 @staff_member_required
@@ -189,11 +198,15 @@ def new_member_export_view(request):
 
         # Validation passed - filter members and generate Excel
         # Filter active members where date_joined is within range
-        new_members = Member.objects.filter(
-            status="active",
-            date_joined__gte=start_date,
-            date_joined__lte=end_date,
-        ).order_by("member_id")
+        new_members = (
+            Member.objects.filter(
+                status="active",
+                date_joined__gte=start_date,
+                date_joined__lte=end_date,
+            )
+            .only(*NEW_MEMBER_FIELDS)
+            .order_by("member_id")
+        )
 
         # Import and call Excel generation function
         from ..reports.excel import generate_new_member_excel
@@ -351,7 +364,7 @@ def milestone_export_view(request):
         active_members_with_milestones = Member.objects.filter(
             status="active",
             milestone_date__isnull=False,
-        )
+        ).only(*MILESTONE_FIELDS)
 
         # Filter members whose milestone date (this year) falls within selected range
         current_year = today.year
@@ -403,7 +416,8 @@ def deactivate_expired_members_report_view(request):
         members = Member.objects.filter(member_uuid__in=member_uuids, status="active")
 
         deactivated_count = 0
-        errors = []
+        errors = deque(maxlen=MAX_DEACTIVATION_ERRORS)
+        error_count = 0
 
         with transaction.atomic():
             for member in members:
@@ -422,10 +436,13 @@ def deactivate_expired_members_report_view(request):
                             errors.append(
                                 f"{member.full_name} has a payment after expiration"
                             )
+                            error_count += 1
                     else:
                         errors.append(f"{member.full_name} is not expired 90+ days")
+                        error_count += 1
                 except Exception as e:
                     errors.append(f"Error deactivating {member.full_name}: {str(e)}")
+                    error_count += 1
 
         if deactivated_count > 0:
             messages.success(
@@ -435,6 +452,11 @@ def deactivate_expired_members_report_view(request):
         if errors:
             for error in errors:
                 messages.error(request, error)
+            if error_count > len(errors):
+                messages.error(
+                    request,
+                    f"{error_count - len(errors)} more member(s) could not be deactivated.",
+                )
 
         return redirect("members:deactivate_expired_members")
 
@@ -478,10 +500,14 @@ def expires_two_months_export_view(request):
         sixty_days_ago = today - timedelta(days=60)
 
         # Filter active members expired 60+ days ago
-        members = Member.objects.filter(
-            status="active",
-            expiration_date__lte=sixty_days_ago,
-        ).order_by("member_id")
+        members = (
+            Member.objects.filter(
+                status="active",
+                expiration_date__lte=sixty_days_ago,
+            )
+            .only(*EXPIRES_TWO_MONTHS_FIELDS)
+            .order_by("member_id")
+        )
 
         # Generate Excel export
         return generate_expires_two_months_excel(members)
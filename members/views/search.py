@@ -1,9 +1,39 @@
 from datetime import timedelta, date
 from django.shortcuts import render
-from django.db.models import Q
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.db.models.functions import Upper
 from django.contrib.auth.decorators import login_required
 
 from ..models import Member, Payment
+from ..signals import SEARCH_STATS_CACHE_KEY, SEARCH_STATS_TIMEOUT
+
+# Alphabet browse letter ranges as [start, end) bounds on the upper-cased
+# last name. No last name sorts at or after "ZZZZ", so that bound ends the
+# last range at Z and keeps out names after it, such as non-ASCII initials
+BROWSE_RANGES = {
+    "A-C": ("A", "D"),
+    "D-F": ("D", "G"),
+    "G-I": ("G", "J"),
+    "J-L": ("J", "M"),
+    "M-O": ("M", "P"),
+    "P-R": ("P", "S"),
+    "S-U": ("S", "V"),
+    "V-Z": ("V", "ZZZZ"),
+}
+
+# Member columns rendered in the search results
+SEARCH_RESULT_FIELDS = (
+    "member_uuid",
+    "member_id",
+    "first_name",
+    "last_name",
+    "email",
+    "status",
+    "date_joined",
+    "expiration_date",
+    "member_type__member_type",
+)
 
 
 @login_required
@@ -12,6 +42,20 @@ def landing_view(request):
     return render(request, "members/landing.html")
 
 
+def _search_stats():
+    """Count active members, payments and available member IDs (1-1000 range)"""
+    # Active members and the distinct member IDs they use come from one
+    # aggregate query (COUNT skips NULL IDs)
+    active_stats = Member.objects.filter(status="active").aggregate(
+        members=Count("pk"), used_ids=Count("member_id", distinct=True)
+    )
+    return {
+        "active_members_count": active_stats["members"],
+        "total_payments_count": Payment.objects.count(),
+        "available_ids_count": 1000 - active_stats["used_ids"],
+    }
+
+
 @login_required
 def search_view(request):
     """Simple member search page with alphabet browsing and status filtering"""
@@ -21,20 +65,16 @@ def search_view(request):
     recent_filter = request.GET.get("recent", "").strip()
     members = None
 
-    # Get quick stats for the search page
-    active_members_count = Member.objects.filter(status="active").count()
-    total_payments_count = Payment.objects.count()
-
-    # Calculate available IDs (1-1000 range)
-    used_ids = set(
-        Member.objects.filter(status="active", member_id__isnull=False).values_list(
-            "member_id", flat=True
-        )
+    # Get quick stats for the search page (cached per worker process for up to
+    # SEARCH_STATS_TIMEOUT; a save only clears the saving process's copy)
+    stats = cache.get_or_set(
+        SEARCH_STATS_CACHE_KEY, _search_stats, SEARCH_STATS_TIMEOUT
     )
-    available_ids_count = 1000 - len(used_ids)
 
     # Start with base queryset and apply status filter
-    base_queryset = Member.objects.select_related("member_type")
+    base_queryset = Member.objects.select_related("member_type").only(
+        *SEARCH_RESULT_FIELDS
+    )
 
     # Apply status filter
     if status_filter == "active":
@@ -52,36 +92,25 @@ def search_view(request):
 
     # Handle alphabet browsing
     elif browse_range:
-        # Define the letter ranges
-        range_mapping = {
-            "A-C": ["A", "B", "C"],
-            "D-F": ["D", "E", "F"],
-            "G-I": ["G", "H", "I"],
-            "J-L": ["J", "K", "L"],
-            "M-O": ["M", "N", "O"],
-            "P-R": ["P", "Q", "R"],
-            "S-U": ["S", "T", "U"],
-            "V-Z": ["V", "W", "X", "Y", "Z"],
-        }
-
-        if browse_range in range_mapping:
-            letters = range_mapping[browse_range]
-            # Create Q objects for each letter in the range
-            letter_filters = Q()
-            for letter in letters:
-                letter_filters |= Q(last_name__istartswith=letter)
-
-            members = base_queryset.filter(letter_filters).order_by(
-                "last_name", "first_name"
+        if browse_range in BROWSE_RANGES:
+            start, end = BROWSE_RANGES[browse_range]
+            # One range predicate instead of an OR of ILIKEs, so the
+            # UPPER(last_name) index can serve it
+            members = (
+                base_queryset.annotate(last_name_upper=Upper("last_name"))
+                .filter(last_name_upper__gte=start, last_name_upper__lt=end)
+                .order_by("last_name", "first_name")
             )
 
     # Perform search if query provided (takes precedence over browse)
     elif query:
-        try:
-            # Try to parse as member ID
-            member_id = int(query)
-            members = base_queryset.filter(member_id=member_id)
-        except ValueError:
+        # An all-digit query is a member ID; checking first avoids raising and
+        # catching ValueError for every name search. Unlike int(), isdecimal()
+        # rejects signs and underscores ("+5", "1_0"), so those go to the name
+        # search instead (surrounding whitespace is already stripped above)
+        if query.isdecimal():
+            members = base_queryset.filter(member_id=int(query))
+        else:
             # Search by name
             members = base_queryset.filter(
                 Q(first_name__icontains=query) | Q(last_name__icontains=query)
@@ -93,9 +122,7 @@ def search_view(request):
         "status_filter": status_filter,
         "recent_filter": recent_filter,
         "members": members,
-        "active_members_count": active_members_count,
-        "total_payments_count": total_payments_count,
-        "available_ids_count": available_ids_count,
+        **stats,
     }
 
     return render(request, "members/search.html", context)
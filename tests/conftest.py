@@ -6,6 +6,7 @@ This file ensures Django is configured before any Django imports happen.
 
 import os
 import django
+import pytest
 from django.conf import settings
 
 # Configure Django settings before any Django imports
@@ -19,3 +20,13 @@ if not settings.configured:
     settings.STATICFILES_STORAGE = (
         "django.contrib.staticfiles.storage.StaticFilesStorage"
     )
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start each test with an empty cache (rolled-back rows send no signals)"""
+    from django.core.cache import cache
+
+    cache.clear()
+    yield
+    cache.clear()
@@ -15,10 +15,11 @@ class TestBackupDatabaseCommand:
         """Test command creates backup successfully."""
         mock_create_backup.return_value = {
             "success": True,
-            "filename": "backup_dev_2025-01-15_14-30-00.json",
-            "filepath": "backups/dev/backup_dev_2025-01-15_14-30-00.json",
+            "filename": "backup_dev_2025-01-15_14-30-00.json.gz",
+            "filepath": "backups/dev/backup_dev_2025-01-15_14-30-00.json.gz",
             "size": 5000,
             "db_type": "dev",
+            "sha256": "ab" * 32,
             "error": None,
         }
 
@@ -27,9 +28,10 @@ class TestBackupDatabaseCommand:
 
         output = out.getvalue()
         assert "Backup created" in output
-        assert "backup_dev_2025-01-15_14-30-00.json" in output
+        assert "backup_dev_2025-01-15_14-30-00.json.gz" in output
         assert "5,000" in output  # Number is formatted with comma
         assert "dev" in output
+        assert "ab" * 32 in output
 
     @patch("members.management.commands.backup_database.create_backup")
     def test_command_handles_failure(self, mock_create_backup):
@@ -49,3 +51,20 @@ class TestBackupDatabaseCommand:
         output = out.getvalue()
         assert "Backup failed" in output
         assert "Export failed" in output
+
+    @patch("members.management.commands.backup_database.create_backup")
+    def test_command_passes_fast_flag(self, mock_create_backup):
+        """Test --fast is passed through to create_backup."""
+        mock_create_backup.return_value = {
+            "success": True,
+            "filename": "backup_dev_2025-01-15_14-30-00.json.gz",
+            "filepath": "backups/dev/backup_dev_2025-01-15_14-30-00.json.gz",
+            "size": 5000,
+            "db_type": "dev",
+            "sha256": "ab" * 32,
+            "error": None,
+        }
+
+        call_command("backup_database", "--fast", stdout=StringIO())
+
+        mock_create_backup.assert_called_once_with(db_type=None, fast=True)
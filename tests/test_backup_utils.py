@@ -2,9 +2,19 @@
 Tests for backup utility functions.
 """
 
+import gzip
+import hashlib
+import json
 import os
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from django.core.management.base import CommandError
+
+from members.models import MemberType
+
 from members.backup_utils import (
     create_backup,
     _detect_database_type,
@@ -54,21 +64,20 @@ class TestCreateBackup:
     """Test backup creation."""
 
     @patch("members.backup_utils.os.path.getsize")
-    @patch("members.backup_utils.subprocess.run")
+    @patch("members.backup_utils.call_command")
     @patch("members.backup_utils._detect_database_type")
     @patch("members.backup_utils._ensure_backup_directory")
     def test_create_backup_success(
-        self, mock_dir, mock_detect, mock_subprocess, mock_getsize
+        self, mock_dir, mock_detect, mock_call_command, mock_getsize, tmp_path
     ):
         """Test successful backup creation."""
         mock_detect.return_value = "dev"
-        mock_backup_dir = Path("backups/dev")
-        mock_dir.return_value = mock_backup_dir
+        mock_dir.return_value = tmp_path
+
+        def run_dumpdata(*args, **kwargs):
+            kwargs["stdout"].write("[]")
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = '{"model": "members.member", "pk": 1, "fields": {}}' * 10
-        mock_subprocess.return_value = mock_result
+        mock_call_command.side_effect = run_dumpdata
         mock_getsize.return_value = 1000
 
         result = create_backup()
@@ -76,38 +85,107 @@ class TestCreateBackup:
         assert result["success"] is True
         assert result["filename"] is not None
         assert result["filename"].startswith("backup_dev_")
-        assert result["filename"].endswith(".json")
+        assert result["filename"].endswith(".json.gz")
         assert result["db_type"] == "dev"
         assert result["error"] is None
 
-    @patch("members.backup_utils.subprocess.run")
+        # dumpdata runs in-process, writing through the gzip stream
+        kwargs = mock_call_command.call_args.kwargs
+        assert "output" not in kwargs
+        assert kwargs["database"] == "default"
+        assert kwargs["use_natural_foreign_keys"] is True
+        assert kwargs["use_natural_primary_keys"] is True
+
+        # Checksum of the compressed file, also written in sha256sum format
+        backup_bytes = Path(result["filepath"]).read_bytes()
+        assert gzip.decompress(backup_bytes) == b"[]"
+        expected = hashlib.sha256(backup_bytes).hexdigest()
+        assert result["sha256"] == expected
+        checksum_file = Path(result["checksum_filepath"])
+        assert checksum_file.name == result["filename"] + ".sha256"
+        assert checksum_file.read_text() == f"{expected}  {result['filename']}\n"
+
+    @patch("members.backup_utils.os.path.getsize")
+    @patch("members.backup_utils.call_command")
+    @patch("members.backup_utils._detect_database_type")
+    @patch("members.backup_utils._ensure_backup_directory")
+    def test_create_backup_fast_uses_primary_keys(
+        self, mock_dir, mock_detect, mock_call_command, mock_getsize, tmp_path
+    ):
+        """Test fast backups skip natural keys."""
+        mock_detect.return_value = "dev"
+        mock_dir.return_value = tmp_path
+
+        def run_dumpdata(*args, **kwargs):
+            kwargs["stdout"].write("[]")
+
+        mock_call_command.side_effect = run_dumpdata
+        mock_getsize.return_value = 1000
+
+        result = create_backup(fast=True)
+
+        assert result["success"] is True
+        kwargs = mock_call_command.call_args.kwargs
+        assert kwargs["use_natural_foreign_keys"] is False
+        assert kwargs["use_natural_primary_keys"] is False
+
+    @patch("members.backup_utils.call_command")
     @patch("members.backup_utils._detect_database_type")
-    def test_create_backup_failure(self, mock_detect, mock_subprocess):
+    @patch("members.backup_utils._ensure_backup_directory")
+    def test_create_backup_failure(
+        self, mock_dir, mock_detect, mock_call_command, tmp_path
+    ):
         """Test backup creation failure."""
         mock_detect.return_value = "dev"
+        mock_dir.return_value = tmp_path
 
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stderr = "Error occurred"
-        mock_subprocess.return_value = mock_result
+        mock_call_command.side_effect = CommandError("Error occurred")
 
         result = create_backup()
 
         assert result["success"] is False
         assert result["error"] == "Error occurred"
+        # Partial backup file is removed
+        assert list(tmp_path.iterdir()) == []
 
-    @patch("members.backup_utils.subprocess.run")
+    @patch("members.backup_utils.call_command")
     @patch("members.backup_utils._detect_database_type")
-    def test_create_backup_empty_output(self, mock_detect, mock_subprocess):
+    @patch("members.backup_utils._ensure_backup_directory")
+    def test_create_backup_empty_output(
+        self, mock_dir, mock_detect, mock_call_command, tmp_path
+    ):
         """Test backup creation with empty output."""
         mock_detect.return_value = "dev"
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = ""
-        mock_subprocess.return_value = mock_result
+        mock_dir.return_value = tmp_path
 
         result = create_backup()
 
         assert result["success"] is False
         assert "empty" in result["error"].lower()
+        assert result["sha256"] is None
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.django_db
+    @patch("members.backup_utils._detect_database_type")
+    @patch("members.backup_utils._ensure_backup_directory")
+    def test_create_backup_runs_dumpdata(self, mock_dir, mock_detect, tmp_path):
+        """Test a real dumpdata run produces a readable backup and its hash."""
+        mock_detect.return_value = "dev"
+        mock_dir.return_value = tmp_path
+        MemberType.objects.create(
+            member_type="Regular", member_dues=Decimal("30.00"), num_months=1
+        )
+
+        result = create_backup()
+
+        assert result["success"] is True
+        backup_bytes = Path(result["filepath"]).read_bytes()
+        assert result["size"] == len(backup_bytes)
+        assert result["sha256"] == hashlib.sha256(backup_bytes).hexdigest()
+        objects = json.loads(gzip.decompress(backup_bytes))
+        member_types = [
+            obj["fields"] for obj in objects if obj["model"] == "members.membertype"
+        ]
+        assert member_types == [
+            {"member_type": "Regular", "member_dues": "30.00", "num_months": 1}
+        ]
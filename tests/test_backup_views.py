@@ -3,7 +3,7 @@ Tests for backup views.
 """
 
 import pytest
-from unittest.mock import patch, mock_open
+from unittest.mock import patch
 from django.test import RequestFactory, Client
 from django.contrib.auth.models import User
 from members.views.backups import download_backup_view
@@ -50,37 +50,40 @@ class TestDownloadBackupView:
         assert response.status_code in [302, 403]
 
     @patch("members.views.backups.create_backup")
-    @patch("members.views.backups.os.path.exists")
-    @patch("members.views.backups.os.unlink")
     def test_view_creates_and_downloads_backup(
-        self, mock_unlink, mock_exists, mock_create_backup, staff_user
+        self, mock_create_backup, staff_user, tmp_path
     ):
-        """Test view creates backup and downloads it."""
+        """Test view creates backup and streams it, deleting the temporary files."""
+        backup_path = tmp_path / "backup_dev_2025-01-15_14-30-00.json.gz"
+        backup_path.write_bytes(b'{"test": "data"}')
+        checksum_path = tmp_path / "backup_dev_2025-01-15_14-30-00.json.gz.sha256"
+        checksum_path.write_text("checksum")
         mock_create_backup.return_value = {
             "success": True,
-            "filename": "backup_dev_2025-01-15_14-30-00.json",
-            "filepath": "backups/dev/backup_dev_2025-01-15_14-30-00.json",
+            "filename": backup_path.name,
+            "filepath": str(backup_path),
             "size": 5000,
             "db_type": "dev",
+            "checksum_filepath": str(checksum_path),
             "error": None,
         }
-        mock_exists.return_value = True
 
         factory = RequestFactory()
         request = factory.get("/reports/backup-download/")
         request.user = staff_user
 
-        # Mock file reading
-        with patch("builtins.open", mock_open(read_data=b'{"test": "data"}')):
-            response = download_backup_view(request)
+        response = download_backup_view(request)
 
         assert response.status_code == 200
-        assert response["Content-Type"] == "application/json"
-        assert "backup_dev_2025-01-15_14-30-00.json" in response["Content-Disposition"]
-        assert b'{"test": "data"}' in response.content
+        assert response.streaming
+        assert response["Content-Type"] == "application/gzip"
+        assert backup_path.name in response["Content-Disposition"]
+        assert b"".join(response.streaming_content) == b'{"test": "data"}'
+        response.close()
 
-        # Verify file was deleted
-        mock_unlink.assert_called_once()
+        # Verify the temporary files were deleted
+        assert not backup_path.exists()
+        assert not checksum_path.exists()
 
     @patch("members.views.backups.create_backup")
     def test_view_handles_backup_failure(self, mock_create_backup, staff_user):
@@ -112,8 +115,8 @@ class TestDownloadBackupView:
         """Test view handles file read errors gracefully."""
         mock_create_backup.return_value = {
             "success": True,
-            "filename": "backup_dev_2025-01-15_14-30-00.json",
-            "filepath": "backups/dev/backup_dev_2025-01-15_14-30-00.json",
+            "filename": "backup_dev_2025-01-15_14-30-00.json.gz",
+            "filepath": "backups/dev/backup_dev_2025-01-15_14-30-00.json.gz",
             "size": 5000,
             "db_type": "dev",
             "error": None,
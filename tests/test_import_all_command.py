@@ -0,0 +1,102 @@
+"""
+Tests for the import_all management command.
+"""
+
+import pytest
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from members.models import Member, MemberType, Payment, PaymentMethod
+
+CSV_NAMES = (
+    "current_member_types.csv",
+    "current_payment_methods.csv",
+    "current_members.csv",
+    "current_dead.csv",
+    "current_payments.csv",
+)
+
+
+@pytest.mark.django_db
+class TestImportAllCommand:
+    """Test import_all management command."""
+
+    @pytest.fixture
+    def data_dir(self, tmp_path):
+        """Create empty CSV files with the expected names"""
+        for name in CSV_NAMES:
+            (tmp_path / name).write_text("")
+        return tmp_path
+
+    @patch("members.management.commands.import_all.clear_tables")
+    @patch("members.management.commands.import_all.call_command")
+    def test_runs_imports_in_dependency_order(
+        self, mock_call_command, mock_clear_tables, data_dir
+    ):
+        """Test imports run in order, after clearing dependents first."""
+        call_command(
+            "import_all",
+            data_dir=str(data_dir),
+            clear_existing=True,
+            stdout=StringIO(),
+        )
+
+        mock_clear_tables.assert_called_once_with(
+            Payment, Member, PaymentMethod, MemberType
+        )
+        commands = [c.args[0] for c in mock_call_command.call_args_list]
+        assert commands == [
+            "import_member_types",
+            "import_payment_methods",
+            "import_members",
+            "import_payments",
+        ]
+        members_kwargs = mock_call_command.call_args_list[2].kwargs
+        assert members_kwargs["dead_csv"] == data_dir / "current_dead.csv"
+        assert members_kwargs["use_copy"] is False
+
+    @patch("members.management.commands.import_all.call_command")
+    def test_missing_file_fails_before_import(self, mock_call_command, data_dir):
+        """Test a missing CSV is reported before anything is imported."""
+        (data_dir / "current_payments.csv").unlink()
+
+        with pytest.raises(CommandError, match="current_payments.csv"):
+            call_command("import_all", data_dir=str(data_dir), stdout=StringIO())
+
+        mock_call_command.assert_not_called()
+
+    @patch("members.management.commands.import_all.call_command")
+    def test_clear_existing_empties_every_table(self, mock_call_command, data_dir):
+        """Test --clear-existing removes payments, members and both lookups."""
+        member_type = MemberType.objects.create(
+            member_type="Regular", member_dues=Decimal("30.00"), num_months=1
+        )
+        payment_method = PaymentMethod.objects.create(payment_method="Cash")
+        member = Member.objects.create(
+            first_name="Test",
+            last_name="Member",
+            member_type=member_type,
+            expiration_date=date(2025, 12, 31),
+            date_joined=date(2020, 1, 1),
+        )
+        Payment.objects.create(
+            member=member,
+            payment_method=payment_method,
+            amount=Decimal("30.00"),
+            date=date(2025, 1, 15),
+        )
+
+        call_command(
+            "import_all",
+            data_dir=str(data_dir),
+            clear_existing=True,
+            stdout=StringIO(),
+        )
+
+        for model in (Payment, Member, PaymentMethod, MemberType):
+            assert not model.objects.exists()
@@ -0,0 +1,440 @@
+"""
+Tests for the CSV import management commands
+
+Tests:
+- import_member_types creates types, skipping existing ones and bad rows
+- import_payment_methods creates methods, skipping existing ones and blank rows
+- import_members imports active and inactive members, rejecting reused IDs
+  and skipping inactive members whose name matches an existing member
+- import_payments links payments by member ID or name and skips duplicates
+- ImportLogger counts in each command's summary file
+- A failed batch insert aborts the import with its own error
+- --clear-existing on the lookup tables: one TRUNCATE with the referencing
+  tables on PostgreSQL, refused while other rows still reference them
+"""
+
+import csv
+import pytest
+from datetime import date, timedelta
+from decimal import Decimal
+from functools import partial
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import IntegrityError
+
+from members.management.commands.import_members import MEMBER_COLUMNS
+from members.management.commands.import_payments import PAYMENT_COLUMNS
+from members.management.commands.import_utils import BatchInserter
+from members.models import Member, MemberType, Payment, PaymentMethod
+
+SUMMARY_LABELS = {
+    "Successfully Created": "created",
+    "Errors": "errors",
+    "Skipped": "skipped",
+    "Duplicates": "duplicates",
+}
+
+
+def write_csv(path, header, rows):
+    """Write a CSV file with a header row and return its path"""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+    return path
+
+
+def member_row(member_id, first_name, last_name, member_type="Regular"):
+    """Build a members CSV row in MEMBER_COLUMNS order"""
+    values = {
+        "member_id": member_id,
+        "first_name": first_name,
+        "last_name": last_name,
+        "email": f"{first_name.lower()}@example.com",
+        "member_type": member_type,
+        "date_joined": "2020-01-15",
+        "expiration_date": "2025-06-30",
+        "milestone_date": "",
+        "home_address": "1 Main St",
+        "home_city": "Springfield",
+        "home_state": "CA",
+        "home_zip": "90000",
+        "home_phone": "555-0100",
+    }
+    return [values[column] for column in MEMBER_COLUMNS]
+
+
+def summary_counts(tmp_path, log_name):
+    """Read the result counts from an import's SUMMARY log file"""
+    (summary_file,) = (tmp_path / "logs" / "imports").glob(f"{log_name}_*_SUMMARY.txt")
+    counts = {}
+    for line in summary_file.read_text(encoding="utf-8").splitlines():
+        label, _, value = line.partition(":")
+        # Drop the leading emoji: "  ✅ Successfully Created" -> "Successfully Created"
+        words = label.split(maxsplit=1)
+        if words and words[-1] in SUMMARY_LABELS:
+            counts[SUMMARY_LABELS[words[-1]]] = int(value)
+    return counts
+
+
+@pytest.fixture(autouse=True)
+def logs_in_tmp_path(tmp_path, monkeypatch):
+    """Write logs/imports under a temporary directory"""
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.fixture
+def pg_connection():
+    """Make the import helpers issue their PostgreSQL statements to a mock"""
+    with patch("members.management.commands.import_utils.connection") as mock:
+        mock.vendor = "postgresql"
+        mock.ops.quote_name.side_effect = lambda name: f'"{name}"'
+        yield mock
+
+
+def executed_sql(pg_connection):
+    """SQL statements sent to the mocked PostgreSQL connection"""
+    cursor = pg_connection.cursor.return_value.__enter__.return_value
+    return [c.args[0] for c in cursor.execute.call_args_list]
+
+
+@pytest.fixture
+def member_type(db):
+    """Create the member type used by the members CSVs"""
+    return MemberType.objects.create(
+        member_type="Regular", member_dues=Decimal("30.00"), num_months=1
+    )
+
+
+@pytest.fixture
+def payment_method(db):
+    """Create the payment method used by the payments CSV"""
+    return PaymentMethod.objects.create(payment_method="Cash")
+
+
+@pytest.mark.django_db
+class TestImportMemberTypes:
+    """Test import_member_types command"""
+
+    def test_imports_member_types(self, tmp_path, member_type):
+        """Test new types are created and existing or invalid rows are not"""
+        csv_file = write_csv(
+            tmp_path / "member_types.csv",
+            ["member_type", "member_dues", "num_months"],
+            [
+                ["Life", "0.00", "0"],
+                ["Senior", "20.50", "1"],
+                ["Regular", "30.00", "1"],  # Already exists
+                ["", "10.00", "1"],  # Missing name
+                ["Broken", "abc", "1"],  # Invalid dues
+            ],
+        )
+
+        call_command("import_member_types", csv_file=str(csv_file), stdout=StringIO())
+
+        assert set(MemberType.objects.values_list("member_type", flat=True)) == {
+            "Regular",
+            "Life",
+            "Senior",
+        }
+        assert MemberType.objects.get(member_type="Senior").member_dues == Decimal(
+            "20.50"
+        )
+        assert summary_counts(tmp_path, "import_member_types") == {
+            "created": 2,
+            "errors": 2,
+            "skipped": 1,
+            "duplicates": 0,
+        }
+
+    def test_clear_existing_truncates_referencing_tables(
+        self, tmp_path, member_type, pg_connection
+    ):
+        """Test member types are truncated together with members and payments"""
+        csv_file = write_csv(
+            tmp_path / "member_types.csv",
+            ["member_type", "member_dues", "num_months"],
+            [["Life", "0.00", "0"]],
+        )
+
+        call_command(
+            "import_member_types",
+            csv_file=str(csv_file),
+            clear_existing=True,
+            stdout=StringIO(),
+        )
+
+        assert (
+            'TRUNCATE TABLE "members_membertype", "members_member", '
+            '"members_payment" RESTART IDENTITY'
+        ) in executed_sql(pg_connection)
+
+    def test_clear_existing_refused_while_members_exist(
+        self, tmp_path, member_type, pg_connection
+    ):
+        """Test member types are kept while members still reference them"""
+        Member.objects.create(
+            first_name="Alice",
+            last_name="Smith",
+            member_type=member_type,
+            expiration_date=date(2025, 6, 30),
+            date_joined=date(2020, 1, 15),
+        )
+        csv_file = write_csv(
+            tmp_path / "member_types.csv",
+            ["member_type", "member_dues", "num_months"],
+            [["Life", "0.00", "0"]],
+        )
+
+        with pytest.raises(CommandError, match="members_member still references"):
+            call_command(
+                "import_member_types",
+                csv_file=str(csv_file),
+                clear_existing=True,
+                stdout=StringIO(),
+            )
+
+        assert not any("TRUNCATE" in sql for sql in executed_sql(pg_connection))
+        assert list(MemberType.objects.all()) == [member_type]
+
+
+@pytest.mark.django_db
+class TestImportPaymentMethods:
+    """Test import_payment_methods command"""
+
+    def test_imports_payment_methods(self, tmp_path, payment_method):
+        """Test new methods are created and existing or blank rows are not"""
+        csv_file = write_csv(
+            tmp_path / "payment_methods.csv",
+            ["payment_method"],
+            [["Check"], ["Cash"], [""], ["Card"]],
+        )
+
+        call_command(
+            "import_payment_methods", csv_file=str(csv_file), stdout=StringIO()
+        )
+
+        assert set(PaymentMethod.objects.values_list("payment_method", flat=True)) == {
+            "Cash",
+            "Check",
+            "Card",
+        }
+        assert summary_counts(tmp_path, "import_payment_methods") == {
+            "created": 2,
+            "errors": 1,
+            "skipped": 1,
+            "duplicates": 0,
+        }
+
+    def test_clear_existing_truncates_payments_too(self, tmp_path, pg_connection):
+        """Test payment methods are truncated together with payments"""
+        csv_file = write_csv(
+            tmp_path / "payment_methods.csv", ["payment_method"], [["Check"]]
+        )
+
+        call_command(
+            "import_payment_methods",
+            csv_file=str(csv_file),
+            clear_existing=True,
+            stdout=StringIO(),
+        )
+
+        assert (
+            'TRUNCATE TABLE "members_paymentmethod", "members_payment" '
+            "RESTART IDENTITY"
+        ) in executed_sql(pg_connection)
+
+    def test_clear_existing_rolls_back_when_refused(
+        self, tmp_path, member_type, payment_method
+    ):
+        """Test a refused clear leaves payment methods and payments in place"""
+        member = Member.objects.create(
+            first_name="Alice",
+            last_name="Smith",
+            member_type=member_type,
+            expiration_date=date(2025, 6, 30),
+            date_joined=date(2020, 1, 15),
+        )
+        Payment.objects.create(
+            member=member,
+            payment_method=payment_method,
+            amount=Decimal("30.00"),
+            date=date(2025, 1, 15),
+        )
+        csv_file = write_csv(
+            tmp_path / "payment_methods.csv", ["payment_method"], [["Check"]]
+        )
+
+        with pytest.raises(CommandError, match="Import failed"):
+            call_command(
+                "import_payment_methods",
+                csv_file=str(csv_file),
+                clear_existing=True,
+                stdout=StringIO(),
+            )
+
+        assert list(PaymentMethod.objects.all()) == [payment_method]
+        assert Payment.objects.count() == 1
+
+
+@pytest.mark.django_db
+class TestImportMembers:
+    """Test import_members command"""
+
+    def test_imports_active_and_inactive_members(self, tmp_path, member_type):
+        """Test members are created with the right IDs, status and counts"""
+        members_csv = write_csv(
+            tmp_path / "members.csv",
+            MEMBER_COLUMNS,
+            [
+                member_row("1", "Alice", "Smith"),
+                member_row("2", "Bob", "Jones"),
+                member_row("1", "Ann", "Other"),  # Member ID already in use
+                member_row("3", "Cat", "Unknown", member_type="Missing"),
+            ],
+        )
+        dead_csv = write_csv(
+            tmp_path / "dead.csv",
+            MEMBER_COLUMNS,
+            [
+                member_row("7", "ALICE", "smith"),  # Same name as an active member
+                member_row("9", "Carl", "Gone"),
+            ],
+        )
+
+        call_command(
+            "import_members",
+            members_csv=str(members_csv),
+            dead_csv=str(dead_csv),
+            stdout=StringIO(),
+        )
+
+        assert set(
+            Member.objects.filter(status="active").values_list("member_id", flat=True)
+        ) == {1, 2}
+        alice = Member.objects.get(member_id=1)
+        assert (alice.first_name, alice.member_type) == ("Alice", member_type)
+        assert alice.home_city == "Springfield"
+
+        carl = Member.objects.get(last_name="Gone")
+        assert carl.status == "inactive"
+        assert carl.member_id is None
+        assert carl.preferred_member_id == 9
+        assert carl.date_inactivated == date(2025, 6, 30) + timedelta(days=90)
+        assert Member.objects.count() == 3
+
+        assert summary_counts(tmp_path, "import_active_members") == {
+            "created": 2,
+            "errors": 2,
+            "skipped": 0,
+            "duplicates": 0,
+        }
+        assert summary_counts(tmp_path, "import_inactive_members") == {
+            "created": 1,
+            "errors": 0,
+            "skipped": 0,
+            "duplicates": 1,
+        }
+
+    def test_failed_batch_insert_aborts_import(self, tmp_path, member_type):
+        """Test a failed batch insert fails the import instead of one row"""
+        members_csv = write_csv(
+            tmp_path / "members.csv",
+            MEMBER_COLUMNS,
+            [member_row("1", "Alice", "Smith"), member_row("2", "Bob", "Jones")],
+        )
+        dead_csv = write_csv(tmp_path / "dead.csv", MEMBER_COLUMNS, [])
+
+        # Flush on every add, with only the first insert failing
+        small_batches = patch(
+            "members.management.commands.import_members.BatchInserter",
+            partial(BatchInserter, batch_size=1),
+        )
+        failing_insert = patch.object(
+            Member.objects,
+            "bulk_create",
+            side_effect=[IntegrityError("duplicate key"), None],
+        )
+        with small_batches, failing_insert:
+            with pytest.raises(CommandError, match="duplicate key"):
+                call_command(
+                    "import_members",
+                    members_csv=str(members_csv),
+                    dead_csv=str(dead_csv),
+                    stdout=StringIO(),
+                )
+
+
+@pytest.mark.django_db
+class TestImportPayments:
+    """Test import_payments command"""
+
+    @pytest.fixture
+    def members(self, member_type):
+        """Create an active member with an ID and an inactive one without"""
+        active = Member.objects.create(
+            member_id=1,
+            first_name="Alice",
+            last_name="Smith",
+            member_type=member_type,
+            expiration_date=date(2025, 6, 30),
+            date_joined=date(2020, 1, 15),
+        )
+        inactive = Member.objects.create(
+            first_name="Carl",
+            last_name="Gone",
+            member_type=member_type,
+            status="inactive",
+            expiration_date=date(2024, 6, 30),
+            date_joined=date(2020, 1, 15),
+        )
+        return active, inactive
+
+    def test_imports_payments(self, tmp_path, members, payment_method):
+        """Test payments are linked by ID or name and duplicates are skipped"""
+        active, inactive = members
+        csv_file = write_csv(
+            tmp_path / "payments.csv",
+            PAYMENT_COLUMNS,
+            [
+                ["1", "Alice", "Smith", "Cash", "30.00", "2025-01-15", "R1"],
+                # Name fallback, with a case-insensitive payment method
+                ["", "carl", "GONE", "cash", "60.00", "2024-05-01", "R2"],
+                ["1", "Alice", "Smith", "Cash", "30.00", "2025-01-15", "R3"],
+                ["5", "No", "Body", "Cash", "30.00", "2025-01-15", "R4"],
+                ["1", "Alice", "Smith", "Wire", "30.00", "2025-02-15", "R5"],
+                ["1", "Alice", "Smith", "Cash", "", "2025-03-15", "R6"],
+            ],
+        )
+
+        call_command("import_payments", csv_file=str(csv_file), stdout=StringIO())
+
+        assert list(
+            Payment.objects.order_by("receipt_number").values_list(
+                "member", "payment_method", "amount", "date", "receipt_number"
+            )
+        ) == [
+            (
+                active.pk,
+                payment_method.pk,
+                Decimal("30.00"),
+                date(2025, 1, 15),
+                "R1",
+            ),
+            (
+                inactive.pk,
+                payment_method.pk,
+                Decimal("60.00"),
+                date(2024, 5, 1),
+                "R2",
+            ),
+        ]
+        assert summary_counts(tmp_path, "import_payments") == {
+            "created": 2,
+            "errors": 2,
+            "skipped": 1,
+            "duplicates": 1,
+        }
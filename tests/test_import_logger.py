@@ -0,0 +1,82 @@
+"""
+Tests for ImportLogger
+
+Tests:
+- Records are written through persistent log file handles
+- Handles are closed by the context manager and by write_summary()
+- Log files are only created once a record of their type is logged
+- Records logged from several threads are numbered without gaps
+"""
+
+import gzip
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from members.management.commands.import_logger import ImportLogger
+
+
+def read_error_log(logger):
+    """Return the decompressed contents of a logger's error log"""
+    with gzip.open(logger.error_log_file, "rt", encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.mark.unit
+class TestImportLogger:
+    """Test ImportLogger file output"""
+
+    @pytest.fixture(autouse=True)
+    def logs_in_tmp_path(self, tmp_path, monkeypatch):
+        """Write logs/imports under a temporary directory"""
+        monkeypatch.chdir(tmp_path)
+
+    def test_context_manager_writes_and_closes(self):
+        """Test that records are on disk once the logger is closed"""
+        with ImportLogger("test_import", "data.csv") as logger:
+            logger.log_error(2, "Bad row", {"name": "x"})
+            logger.log_skipped(3, "Blank row")
+            logger.log_duplicate(4, "Seen before")
+            logger.log_success(5, "Created row", "obj")
+
+        errors = read_error_log(logger)
+        assert "ERROR #1" in errors
+        assert "  name: x" in errors
+        assert "SKIPPED #1" in errors
+        assert "DUPLICATE #1" in errors
+        assert "Created: obj" in logger.success_log_file.read_text()
+        assert logger.get_stats()["total"] == 4
+
+    def test_write_summary_flushes_logs(self):
+        """Test that write_summary closes the row logs before summarising"""
+        logger = ImportLogger("test_import", "data.csv")
+        logger.log_error(2, "Bad row")
+        logger.write_summary()
+
+        assert "ERROR #1" in read_error_log(logger)
+        assert "Errors: 1" in logger.summary_log_file.read_text()
+        # Closing again (e.g. from a with block) is harmless
+        logger.close()
+
+    def test_log_files_created_on_first_record(self):
+        """Test that a log with no records is never created"""
+        with ImportLogger("test_import", "data.csv") as logger:
+            logger.log_success(2, "Created row")
+            logger.write_summary()
+
+        assert not logger.error_log_file.exists()
+        assert logger.success_log_file.read_text().startswith("SUCCESS LOG")
+        summary = logger.summary_log_file.read_text()
+        assert "Errors/Skipped: (none)" in summary
+        assert f"Successes: {logger.success_log_file}" in summary
+
+    def test_concurrent_logging(self):
+        """Test that threads sharing a logger neither lose nor reuse numbers"""
+        with ImportLogger("test_import", "data.csv") as logger:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(lambda n: logger.log_error(n, "Bad row"), range(2000)))
+
+        errors = read_error_log(logger)
+        assert logger.error_count == 2000
+        assert errors.count("ERROR #") == 2000
+        assert "ERROR #2000\n" in errors
@@ -0,0 +1,238 @@
+"""
+Tests for the shared CSV import helpers
+
+Tests:
+- parse_csv_date() ISO fast path and parse_date fallback
+- parse_amount() currency parsing
+- member_name_key() case-insensitive name keys
+- parse_member_id() member ID parsing
+- read_csv_header() column positions and missing-column errors
+- read_ahead() background row reader
+- dropped_indexes() index drop/rebuild around a bulk load
+- clear_tables() TRUNCATE of the cleared tables and their referencing tables
+"""
+
+import csv
+import pytest
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management.base import CommandError
+
+from members.models import Member, MemberType, Payment, PaymentMethod
+
+from members.management.commands.import_utils import (
+    clear_tables,
+    dropped_indexes,
+    member_name_key,
+    parse_amount,
+    parse_csv_date,
+    parse_member_id,
+    read_ahead,
+    read_csv_header,
+)
+
+
+@pytest.mark.unit
+class TestParseCsvDate:
+    """Test parse_csv_date helper"""
+
+    def test_iso_date(self):
+        """Test that YYYY-MM-DD values are parsed"""
+        assert parse_csv_date("2025-09-30") == date(2025, 9, 30)
+
+    def test_non_padded_date_falls_back(self):
+        """Test that non-zero-padded dates still parse via parse_date"""
+        assert parse_csv_date("2025-9-3") == date(2025, 9, 3)
+
+    def test_blank_and_garbage_return_none(self):
+        """Test that blank or unparseable values return None"""
+        assert parse_csv_date("") is None
+        assert parse_csv_date("notadate") is None
+
+    def test_impossible_date_raises(self):
+        """Test that well-formed but impossible dates raise ValueError"""
+        with pytest.raises(ValueError):
+            parse_csv_date("2025-02-30")
+
+
+@pytest.mark.unit
+class TestParseAmount:
+    """Test parse_amount helper"""
+
+    def test_amounts(self):
+        """Test that plain and padded amounts parse to Decimal"""
+        assert parse_amount("30.00") == Decimal("30.00")
+        assert parse_amount(" 15.5 ") == Decimal("15.5")
+        assert parse_amount("-5") == Decimal("-5")
+
+    def test_invalid_amounts_return_none(self):
+        """Test that blank, malformed and non-finite values return None"""
+        for value in ("", "abc", "NaN", "Infinity", None):
+            assert parse_amount(value) is None
+
+
+@pytest.mark.unit
+class TestParseMemberId:
+    """Test parse_member_id helper"""
+
+    def test_member_ids(self):
+        """Test that numeric IDs parse to int"""
+        assert parse_member_id("42") == 42
+        assert parse_member_id("0") == 0
+
+    def test_invalid_member_ids_return_none(self):
+        """Test that blank, non-numeric and negative values return None"""
+        for value in ("", "abc", "4.5", "-3", None):
+            assert parse_member_id(value) is None
+
+
+@pytest.mark.unit
+class TestMemberNameKey:
+    """Test member_name_key helper"""
+
+    def test_case_insensitive(self):
+        """Test that names differing only in case share a key"""
+        assert member_name_key("Ann", "Able") == member_name_key("ANN", "able")
+        assert member_name_key("Hans", "Strauß") == member_name_key("HANS", "STRAUSS")
+        assert member_name_key("Ann", "Able") != member_name_key("Able", "Ann")
+
+
+@pytest.mark.unit
+class TestReadCsvHeader:
+    """Test read_csv_header helper"""
+
+    def test_maps_column_positions(self):
+        """Test that header names map to their column index"""
+        reader = csv.reader(StringIO("b,a,c\n1,2,3\n"))
+        header, positions = read_csv_header(reader, ("a", "b"))
+        assert header == ["b", "a", "c"]
+        assert positions["a"] == 1
+        assert next(reader)[positions["b"]] == "1"
+
+    def test_missing_column_raises(self):
+        """Test that missing columns raise CommandError"""
+        reader = csv.reader(StringIO("a\n1\n"))
+        with pytest.raises(CommandError, match="missing columns: b"):
+            read_csv_header(reader, ("a", "b"))
+
+
+@pytest.mark.unit
+class TestReadAhead:
+    """Test read_ahead background reader"""
+
+    def test_yields_rows_in_order(self):
+        """Test that every row is yielded in its original order"""
+        rows = [[str(i)] for i in range(50)]
+        assert list(read_ahead(iter(rows), maxsize=4)) == rows
+
+    def test_reader_error_is_raised(self):
+        """Test that errors in the reader thread reach the consumer"""
+
+        def broken_rows():
+            yield ["1"]
+            raise csv.Error("bad row")
+
+        rows = read_ahead(broken_rows())
+        assert next(rows) == ["1"]
+        with pytest.raises(csv.Error, match="bad row"):
+            next(rows)
+
+    def test_stopping_early_does_not_hang(self):
+        """Test that closing the iterator early stops the reader thread"""
+        rows = read_ahead(iter([[str(i)] for i in range(100)]), maxsize=2)
+        assert next(rows) == ["0"]
+        rows.close()
+
+
+@pytest.mark.unit
+class TestDroppedIndexes:
+    """Test dropped_indexes helper"""
+
+    @patch("members.management.commands.import_utils.connection")
+    def test_drops_then_rebuilds_on_postgresql(self, mock_connection):
+        """Test that Meta.indexes are dropped for the block and added back after"""
+        mock_connection.vendor = "postgresql"
+        editor = mock_connection.schema_editor.return_value.__enter__.return_value
+        indexes = Payment._meta.indexes
+
+        with dropped_indexes(Payment):
+            assert editor.remove_index.call_count == len(indexes)
+            editor.add_index.assert_not_called()
+
+        assert editor.add_index.call_count == len(indexes)
+
+    @patch("members.management.commands.import_utils.connection")
+    def test_noop_when_disabled_or_not_postgresql(self, mock_connection):
+        """Test that indexes are untouched unless enabled on PostgreSQL"""
+        mock_connection.vendor = "postgresql"
+        with dropped_indexes(Payment, enabled=False):
+            pass
+        mock_connection.vendor = "sqlite"
+        with dropped_indexes(Payment):
+            pass
+
+        mock_connection.schema_editor.assert_not_called()
+
+
+@pytest.mark.django_db
+class TestClearTables:
+    """Test clear_tables helper"""
+
+    @pytest.fixture
+    def pg_connection(self):
+        """Patch the helper's connection to look like PostgreSQL"""
+        with patch("members.management.commands.import_utils.connection") as mock:
+            mock.vendor = "postgresql"
+            mock.ops.quote_name.side_effect = lambda name: f'"{name}"'
+            yield mock
+
+    def truncate_sql(self, pg_connection):
+        cursor = pg_connection.cursor.return_value.__enter__.return_value
+        cursor.execute.assert_called_once()
+        return cursor.execute.call_args.args[0]
+
+    def test_truncates_referencing_tables_together(self, pg_connection):
+        """Test that empty referencing tables are named in the same TRUNCATE"""
+        clear_tables(MemberType)
+
+        assert self.truncate_sql(pg_connection) == (
+            'TRUNCATE TABLE "members_membertype", "members_member", '
+            '"members_payment" RESTART IDENTITY'
+        )
+
+    def test_truncates_all_models_in_one_statement(self, pg_connection):
+        """Test that several models are cleared with one TRUNCATE"""
+        clear_tables(Payment, Member, PaymentMethod, MemberType)
+
+        sql = self.truncate_sql(pg_connection)
+        for model in (Payment, Member, PaymentMethod, MemberType):
+            assert f'"{model._meta.db_table}"' in sql
+
+    def test_referencing_rows_block_the_clear(self, pg_connection):
+        """Test that rows in a referencing table raise instead of being wiped"""
+        member_type = MemberType.objects.create(
+            member_type="Regular", member_dues=Decimal("30.00"), num_months=1
+        )
+        Member.objects.create(
+            first_name="Test",
+            last_name="Member",
+            member_type=member_type,
+            expiration_date=date(2025, 12, 31),
+            date_joined=date(2020, 1, 1),
+        )
+
+        with pytest.raises(CommandError, match="members_member"):
+            clear_tables(MemberType)
+
+        pg_connection.cursor.assert_not_called()
+
+    def test_orm_delete_on_other_databases(self):
+        """Test that other databases delete the rows through the ORM"""
+        PaymentMethod.objects.create(payment_method="Cash")
+
+        clear_tables(PaymentMethod)
+
+        assert not PaymentMethod.objects.exists()
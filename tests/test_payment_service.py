@@ -145,6 +145,14 @@ class TestPaymentServiceCalculateExpiration:
         # November 30 + 2 months = January 31, 2026
         assert result == date(2026, 1, 31)
 
+    def test_calculate_expiration_exact_decimal_division(self, member):
+        """Test that whole months are counted exactly (no float rounding down)"""
+        member.member_type.member_dues = Decimal("0.10")
+
+        # 0.30 / 0.10 is 2.999... in float but exactly 3 months in Decimal
+        result = PaymentService.calculate_expiration(member, Decimal("0.30"))
+        assert result == date(2025, 6, 30)
+
 
 @pytest.mark.django_db
 @pytest.mark.integration
@@ -290,6 +298,66 @@ class TestPaymentServiceProcessPayment:
         assert isinstance(payment, Payment)
         assert isinstance(was_inactive, bool)
 
+    def test_process_payment_recalculates_stale_expiration(
+        self, active_member, payment_method
+    ):
+        """Test that a payment previewed against an old expiration is recalculated"""
+        payment_data = {
+            "payment_method_id": str(payment_method.pk),
+            "amount": "30.00",
+            "payment_date": "2025-04-15",
+            "receipt_number": "TEST001",
+            "new_expiration": "2025-04-30",
+            "current_expiration": "2025-03-31",
+        }
+        # Another payment extended the membership after the preview
+        Member.objects.filter(pk=active_member.pk).update(
+            expiration_date=date(2025, 4, 30)
+        )
+
+        PaymentService.process_payment(active_member, payment_data)
+
+        active_member.refresh_from_db()
+        assert active_member.expiration_date == date(2025, 5, 31)
+
+    def test_process_payment_skips_member_read(
+        self, active_member, payment_method, django_assert_num_queries
+    ):
+        """Test that an up-to-date member is updated without reading the row"""
+        payment_data = {
+            "payment_method_id": str(payment_method.pk),
+            "amount": "30.00",
+            "payment_date": "2025-04-15",
+            "receipt_number": "TEST001",
+            "new_expiration": "2025-04-30",
+            "current_expiration": "2025-03-31",
+        }
+
+        # Payment method lookup, savepoint, member UPDATE, payment INSERT, release
+        with django_assert_num_queries(5):
+            PaymentService.process_payment(active_member, payment_data)
+
+        active_member.refresh_from_db()
+        assert active_member.expiration_date == date(2025, 4, 30)
+
+    def test_process_payment_keeps_current_expiration(
+        self, active_member, payment_method
+    ):
+        """Test that new_expiration is used when current_expiration still matches"""
+        payment_data = {
+            "payment_method_id": str(payment_method.pk),
+            "amount": "30.00",
+            "payment_date": "2025-04-15",
+            "receipt_number": "TEST001",
+            "new_expiration": "2025-06-30",
+            "current_expiration": "2025-03-31",
+        }
+
+        PaymentService.process_payment(active_member, payment_data)
+
+        active_member.refresh_from_db()
+        assert active_member.expiration_date == date(2025, 6, 30)
+
     def test_process_payment_with_override_expiration_updates_member(
         self, active_member, payment_method
     ):
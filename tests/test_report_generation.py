@@ -292,6 +292,7 @@ class TestNewsletterExcelGeneration:
         ]
         assert headers_sheet1 == expected_headers
         assert headers_sheet2 == expected_headers
+        assert all(cell.font.b for cell in sheet2[1])
 
     def test_no_email_sheet_separate(self, db, member_type):
         """Test that members with and without emails are in separate sheets"""
@@ -351,3 +352,56 @@ class TestNewsletterExcelGeneration:
             ws = wb.active
             # Should only have header row
             assert ws.max_row == 1
+
+    def test_one_query_per_email_group(
+        self, db, django_assert_num_queries, member_with_email, member_without_email
+    ):
+        """Test that the export reads each email group in one query"""
+        queryset = Member.objects.filter(status="active").order_by("member_id")
+
+        with django_assert_num_queries(2):
+            generate_newsletter_excel(queryset)
+
+    def test_single_sheet_when_rows_per_sheet_none(self, db, member_type):
+        """Test that rows_per_sheet=None puts all members with email on one sheet"""
+        for i in range(1, 101):
+            Member.objects.create(
+                member_id=i,
+                first_name=f"Member{i}",
+                last_name="Test",
+                email=f"member{i}@example.com",
+                member_type=member_type,
+                status="active",
+                date_joined=date(2020, 1, 1),
+                expiration_date=date(2025, 12, 31),
+            )
+
+        queryset = Member.objects.filter(status="active").order_by("member_id")
+        response = generate_newsletter_excel(queryset, rows_per_sheet=None)
+
+        wb = load_workbook(BytesIO(response.content))
+
+        assert wb.sheetnames == ["Sheet 1"]
+        assert wb["Sheet 1"].max_row == 101
+        assert wb["Sheet 1"].freeze_panes == "A2"
+
+    def test_whitespace_email_goes_to_no_email_sheet(self, db, member_type):
+        """Test that a whitespace-only email counts as no email"""
+        Member.objects.create(
+            member_id=1,
+            first_name="Blank",
+            last_name="Email",
+            email="   ",
+            member_type=member_type,
+            status="active",
+            date_joined=date(2020, 1, 1),
+            expiration_date=date(2025, 12, 31),
+        )
+
+        queryset = Member.objects.filter(status="active").order_by("member_id")
+        response = generate_newsletter_excel(queryset)
+
+        wb = load_workbook(BytesIO(response.content))
+
+        assert wb.sheetnames == ["No Email"]
+        assert wb["No Email"][2][0].value == 1
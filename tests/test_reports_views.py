@@ -246,6 +246,31 @@ class TestDeactivateExpiredMembersReportView:
         assert member1.member_id is None
         assert member2.member_id is None
 
+    def test_post_view_caps_error_messages(self, client, member_type):
+        """Test that only the first errors are listed and the rest are counted"""
+        # Members that are not expired yet cannot be deactivated
+        members = [
+            Member.objects.create(
+                first_name="Current",
+                last_name=f"Member{i}",
+                member_type=member_type,
+                status="active",
+                expiration_date=date.today() + timedelta(days=30),
+                date_joined=date.today() - timedelta(days=200),
+            )
+            for i in range(12)
+        ]
+
+        response = client.post(
+            "/reports/deactivate-expired/",
+            {"member_uuids": [str(m.member_uuid) for m in members]},
+            follow=True,
+        )
+
+        messages = [str(m) for m in response.context["messages"]]
+        assert len(messages) == 11
+        assert "2 more member(s) could not be deactivated." in messages
+
     def test_view_requires_staff_authentication(self, db, member_type):
         """Test that non-staff users cannot access the view"""
         # Create non-staff user
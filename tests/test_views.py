@@ -9,10 +9,15 @@ Note: These tests validate views work correctly regardless of file organization.
 import pytest
 from datetime import date
 from decimal import Decimal
+from unittest.mock import ANY, patch
+from django.core.cache import cache
+from django.db import connection
 from django.test import Client
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
 
 from members.models import Member, Payment, PaymentMethod, MemberType
+from members.signals import SEARCH_STATS_CACHE_KEY, SEARCH_STATS_TIMEOUT
 
 User = get_user_model()
 
@@ -162,6 +167,17 @@ class TestPaymentViewWithOverride:
         assert member.expiration_date == override_expiration
         assert member.expiration_date != initial_expiration
 
+    def test_member_link_redirects_to_form(self, client, member):
+        """Test a member link skips the search only for an existing member"""
+        response = client.get(f"/payments/add/?member={member.member_uuid}")
+        assert response.status_code == 302
+        assert f"step=form&member={member.member_uuid}" in response.url
+
+        for unknown in ("00000000-0000-0000-0000-000000000000", "not-a-uuid"):
+            response = client.get(f"/payments/add/?member={unknown}")
+            assert response.status_code == 200
+            assert response.context["step"] == "search"
+
 
 @pytest.mark.django_db
 @pytest.mark.integration
@@ -797,3 +813,112 @@ class TestMemberReactivation:
         receipt_numbers = [p.receipt_number for p in payments]
         assert "OLD-001" in receipt_numbers
         assert "NEW-001" in receipt_numbers
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestSearchStats:
+    """Integration tests for the cached search page stats"""
+
+    @pytest.fixture
+    def client(self, db):
+        """Create authenticated client"""
+        user = User.objects.create_user(username="statsuser", password="testpass")
+        client = Client()
+        client.force_login(user)
+        return client
+
+    @pytest.fixture
+    def member_type(self, db):
+        """Create a test member type"""
+        return MemberType.objects.create(
+            member_type="Regular",
+            member_dues=Decimal("30.00"),
+            num_months=1,
+        )
+
+    def create_member(self, member_type, member_id, status="active"):
+        return Member.objects.create(
+            first_name="Stats",
+            last_name=f"Member{member_id}",
+            member_type=member_type,
+            member_id=member_id,
+            status=status,
+            expiration_date=date(2025, 12, 31),
+            date_joined=date(2020, 1, 1),
+        )
+
+    def test_stats_counts(self, client, member_type):
+        """Test active member, payment and available ID counts"""
+        self.create_member(member_type, 1)
+        self.create_member(member_type, 2)
+        self.create_member(member_type, None)
+        self.create_member(member_type, 3, status="inactive")
+
+        response = client.get("/search/")
+
+        assert response.context["active_members_count"] == 3
+        assert response.context["total_payments_count"] == 0
+        assert response.context["available_ids_count"] == 998
+
+    def test_stats_cached_until_member_saved(self, client, member_type):
+        """Test stats are served from cache and refreshed after a save
+
+        Tests run in one process, so the save clears the same LocMemCache the
+        next request reads. Other workers only refresh after the timeout.
+        """
+        self.create_member(member_type, 1)
+        client.get("/search/")
+
+        # Cache hit: the stats queries are skipped
+        with CaptureQueriesContext(connection) as queries:
+            client.get("/search/")
+        assert not any("COUNT" in q["sql"] for q in queries.captured_queries)
+
+        self.create_member(member_type, 2)
+        response = client.get("/search/")
+        assert response.context["active_members_count"] == 2
+
+    def test_stats_cached_with_timeout(self, client):
+        """Test stats are cached with SEARCH_STATS_TIMEOUT, the bound on how
+        long other worker processes can show counts from before a save"""
+        with patch.object(cache, "get_or_set", wraps=cache.get_or_set) as get_or_set:
+            client.get("/search/")
+
+        get_or_set.assert_called_once_with(
+            SEARCH_STATS_CACHE_KEY, ANY, SEARCH_STATS_TIMEOUT
+        )
+
+    def test_alphabet_browse_is_case_insensitive(self, client, member_type):
+        """Test browse ranges match last names regardless of case, A to Z only"""
+        for member_id, last_name in enumerate(
+            ["adams", "Baker", "Carter", "Davis", "zimmer", "Élan"], 1
+        ):
+            member = self.create_member(member_type, member_id)
+            member.last_name = last_name
+            member.save()
+
+        response = client.get("/search/", {"browse": "A-C"})
+        assert {m.last_name for m in response.context["members"]} == {
+            "adams",
+            "Baker",
+            "Carter",
+        }
+
+        response = client.get("/search/", {"browse": "V-Z"})
+        assert [m.last_name for m in response.context["members"]] == ["zimmer"]
+
+    def test_search_results_need_no_extra_queries(self, client, member_type):
+        """Test the results render without loading deferred columns per member"""
+        for member_id in (1, 2, 3):
+            self.create_member(member_type, member_id)
+        client.get("/search/")  # Cache the stats
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get("/search/", {"q": "Stats"})
+        member_queries = [
+            q for q in queries.captured_queries if "members_member" in q["sql"]
+        ]
+
+        assert len(response.context["members"]) == 3
+        assert len(member_queries) == 1